@@ -2,25 +2,27 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
-
-from mpi4py import MPI
+from typing import TYPE_CHECKING
 
 from ....config.declaration import ProjectConfig
 
+if TYPE_CHECKING:
+    from mpi4py import MPI
+
 
-def _cmd(args: argparse.Namespace, comm: MPI.Intracomm) -> None:
+def _cmd(args: argparse.Namespace, comm: MPI.Intracomm | None) -> None:
     """Command to copy the current settings to a specified file in JSON format."""
     # get resolved config
     config: ProjectConfig = args.config
-    # get output path from args (str -> Path)
-    output_path = Path(args.output_path)
-    # check that the parent directory exists
-    if not output_path.parent.exists():
+    # get output path from args (already converted to Path by argparse)
+    output_path: Path = args.output_path
+    # write config to output path in JSON format (fails if parent directory is missing)
+    try:
+        output_path.write_text(config.dump_json())
+    except FileNotFoundError as exc:
         raise FileNotFoundError(
             f"Parent directory does not exist: {output_path.parent}. Provide a valid path."
-        )
-    # write config to output path in JSON format
-    output_path.write_text(config.dump_json())
+        ) from exc
 
 
 def add_parser(subparsers: argparse._SubParsersAction) -> None:
@@ -33,7 +35,7 @@ def add_parser(subparsers: argparse._SubParsersAction) -> None:
     )
     parser.add_argument(
         "output_path",
-        type=str,
+        type=Path,
         help="Path to output the copied configuration JSON file.",
     )
 
@@ -1,33 +1,44 @@
 from __future__ import annotations
 
 import argparse
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from mpi4py import MPI
+from pydantic import BaseModel
 
 from ....config.declaration import ProjectConfig
-from ....config.helpers import load_config_from_file
+from ....config.helpers import construct_project_config, load_config_from_file
 
+if TYPE_CHECKING:
+    from mpi4py import MPI
 
-def _cmd(args: argparse.Namespace, comm: MPI.Intracomm) -> None:
+
+def _cmd(args: argparse.Namespace, comm: MPI.Intracomm | None) -> None:
     """Command to get a specific configuration attribute via a dot-formated key."""
     # get resolved config
     config: ProjectConfig = args.config
 
-    # get config as dictionary - project-level as default and user-level if args.user
-    config_dict: dict[str, Any] = (
-        config.model_dump()
+    # get config - project-level as default and user-level if args.user
+    # the user config file is written by dump_json() and therefore trusted (no validation)
+    value: Any = (
+        config
         if not args.user
-        else ProjectConfig.model_validate(
+        else construct_project_config(
             load_config_from_file(config.meta.user_config_path)
-        ).model_dump()
+        )
     )
-    # walk the dictionary according to dot-formated key
-    value = config_dict
+    # walk the config models according to dot-formated key (only the visited path is touched)
     for part in args.key.split("."):
-        if part not in value:
+        if isinstance(value, BaseModel):
+            if part not in value.__class__.model_fields:
+                raise ValueError(f"Config has no attribute '{args.key}'")
+            value = getattr(value, part)
+        elif isinstance(value, dict) and part in value:
+            value = value[part]
+        else:
             raise ValueError(f"Config has no attribute '{args.key}'")
-        value = value[part]
+    # render whole config sections in their dictionary form
+    if isinstance(value, BaseModel):
+        value = value.model_dump(warnings=False)
     print(f"Attribute '{args.key}' of type {type(value).__name__} has value: {value}")
 
 
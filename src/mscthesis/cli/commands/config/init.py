@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
-
-from mpi4py import MPI
+from typing import TYPE_CHECKING
 
 from ....config.declaration import ProjectConfig
 
+if TYPE_CHECKING:
+    from mpi4py import MPI
+
 
-def _cmd(args: argparse.Namespace, comm: MPI.Intracomm) -> None:
+def _cmd(args: argparse.Namespace, comm: MPI.Intracomm | None) -> None:
     config: ProjectConfig = (
         args.config
     )  # always a defaults instance due to cli.main:main structure
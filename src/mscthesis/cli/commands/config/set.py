@@ -2,16 +2,17 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
-from typing import Any
-
-from mpi4py import MPI
+from typing import TYPE_CHECKING, Any
 
 from ....config.declaration import ProjectConfig
 from ....config.helpers import load_config_from_file
 from ...shared import parse_string_value
 
+if TYPE_CHECKING:
+    from mpi4py import MPI
+
 
-def _cmd(args: argparse.Namespace, comm: MPI.Intracomm) -> None:
+def _cmd(args: argparse.Namespace, comm: MPI.Intracomm | None) -> None:
     """Command to set a configuration key to a specified value."""
     # get resolved config
     config: ProjectConfig = args.config
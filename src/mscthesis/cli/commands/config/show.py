@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import argparse
-
-from mpi4py import MPI
+from typing import TYPE_CHECKING
 
 from ....config.declaration import ProjectConfig
-from ....config.helpers import load_config_from_file
+from ....config.helpers import construct_project_config, load_config_from_file
+
+if TYPE_CHECKING:
+    from mpi4py import MPI
 
 
-def _cmd(args: argparse.Namespace, comm: MPI.Intracomm) -> None:
+def _cmd(args: argparse.Namespace, comm: MPI.Intracomm | None) -> None:
     """Command to print the resolved (user or project) config to stdout in JSON format."""
     config: ProjectConfig = args.config
     if not args.user:
@@ -17,9 +19,9 @@ def _cmd(args: argparse.Namespace, comm: MPI.Intracomm) -> None:
     else:
         # default to user config in home directory
         print("Current user-level configuration:")
-        # load user config from home directory and validate with pydantic model before printing
+        # load user config from home directory - written by dump_json() and therefore trusted
         print(
-            ProjectConfig.model_validate(
+            construct_project_config(
                 load_config_from_file(config.meta.user_config_path)
             ).dump_json()
         )
@@ -1,18 +1,16 @@
 from __future__ import annotations
 
 import argparse
-import os
-import subprocess
+import time
+from functools import partial
 
-from mpi4py import MPI
-
-from ...config.declaration import ProjectConfig, MeshingConfig
-from ...core.meshing.gmeshing import run_gmsh_session
-from ...utilities.paths import ProjectPaths
+from ...config.declaration import MeshingConfig, ProjectConfig
+from ...utilities.paths import ProjectPaths, SamplePaths, fast_resolve
 from ..shared import (
     derive_cli_flags_from_config,
     distribute_command_execution,
     document_command_execution,
+    documentation_enabled,
 )
 
 CMD_NAME = "mesh"
@@ -22,12 +20,19 @@ def _execute_single_sample_id(
     paths: ProjectPaths, config: ProjectConfig, sample_id: str, size: int
 ) -> None:
     """Execute process for a single sample ID"""
+    # deferred import: gmsh is slow to load and only needed when meshing
+    from ...core.meshing.gmeshing import run_gmsh_session
+
+    # time the sample (manifest records it for longest-first scheduling of reruns)
+    start_time = time.perf_counter()
+
     # get resolved config
     cmdconfig: MeshingConfig = config.mesh
 
-    input_path = paths.sample(sample_id).triangulation().require_brep()
+    sample = paths.sample(sample_id)
+    input_path = sample.triangulation().require_brep()
 
-    process_paths = paths.sample(sample_id).meshing()
+    process_paths = sample.meshing()
     process_paths.ensure_dir()
     mesh_path = process_paths.mesh
 
@@ -42,25 +47,34 @@ def _execute_single_sample_id(
         cmdconfig.minimum_distance,
         cmdconfig.maximum_distance,
         cmdconfig.inlet_base_resolution_factor,
+        cmdconfig.num_threads,
+        cmdconfig.algorithm_3d,
     )
 
+    if not documentation_enabled(config):
+        return
+
     document_command_execution(
         process_paths,
         config,
         CMD_NAME,
         size,
         sample_id,
-        inputs={"brep_model": str(input_path.expanduser().resolve())},
-        outputs={"volumetric_mesh": str(mesh_path.expanduser().resolve())},
+        inputs={"brep_model": fast_resolve(input_path)},
+        outputs={"volumetric_mesh": fast_resolve(mesh_path)},
         metadata=metadata,
+        elapsed_seconds=time.perf_counter() - start_time,
     )
 
     return
 
 
-def _cmd(args: argparse.Namespace, comm: MPI.Intracomm) -> None:
-    """Command declaration"""
-    return distribute_command_execution(args, comm, _execute_single_sample_id)
+# command declaration: distribute samples over the MPI ranks
+_cmd = partial(
+    distribute_command_execution,
+    execute_single_sample_id=_execute_single_sample_id,
+    process=SamplePaths.meshing,
+)
 
 
 def add_parser(subparsers: argparse._SubParsersAction) -> None:
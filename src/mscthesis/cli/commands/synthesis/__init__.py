@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from ...shared import lazy_submodules
+
+# command modules are imported on first attribute access, i.e. only once chosen
+__getattr__ = lazy_submodules(__name__, ("uniform",))
@@ -1,26 +1,49 @@
 from __future__ import annotations
 
 import argparse
-
-from mpi4py import MPI
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING
 
 from ....config.declaration import ProjectConfig, UniformSynthesisConfig
-from ....core.io import save_voxels
-from ....core.synthesis.uniform import generate_voxels_from_sample_id
-from ....utilities.paths import ProjectPaths
+from ....utilities.paths import ProjectPaths, SamplePaths, fast_resolve
 from ...shared import (
     derive_cli_flags_from_config,
     distribute_command_execution,
     document_command_execution,
+    documentation_enabled,
 )
 
+if TYPE_CHECKING:
+    from mpi4py import MPI
+
 CMD_NAME = "synthesize-uniform"
+# number of concurrent background save tasks per rank
+SAVE_WORKERS = 1
 
 
 def _execute_single_sample_id(
-    paths: ProjectPaths, config: ProjectConfig, sample_id: str, size: int
+    paths: ProjectPaths,
+    config: ProjectConfig,
+    sample_id: str,
+    size: int,
+    executor: ThreadPoolExecutor | None = None,
+    pending: deque[Future] | None = None,
 ) -> None:
-    """Execute process for a single sample ID"""
+    """Execute process for a single sample ID
+
+    If an executor (and its pending queue) is given, saving and documentation run in the
+    background while the caller generates the next sample.
+    """
+    # deferred imports: keep heavy core modules out of CLI startup
+    from ....core.io import save_voxels
+    from ....core.synthesis.uniform import generate_voxels_from_sample_id
+
+    # time the sample (manifest records it for longest-first scheduling of reruns)
+    start_time = time.perf_counter()
+
     # get resolved config
     cmdconfig: UniformSynthesisConfig = config.synthesize_uniform
 
@@ -41,25 +64,51 @@ def _execute_single_sample_id(
     process_paths.ensure_dir()
     voxels_path = process_paths.voxels
 
-    save_voxels(voxels, voxels_path)
+    def _finish() -> None:
+        """Save the voxel model and document the sample"""
+        save_voxels(voxels, voxels_path)
+        if not documentation_enabled(config):
+            return
 
-    document_command_execution(
-        process_paths,
-        config,
-        CMD_NAME,
-        size,
-        sample_id,
-        inputs={},
-        outputs={"voxel_model": str(voxels_path.expanduser().resolve())},
-        metadata=metadata,
-    )
+        document_command_execution(
+            process_paths,
+            config,
+            CMD_NAME,
+            size,
+            sample_id,
+            inputs={},
+            outputs={"voxel_model": fast_resolve(voxels_path)},
+            metadata=metadata,
+            elapsed_seconds=time.perf_counter() - start_time,
+        )
+
+    if executor is None or pending is None:
+        _finish()
+        return
+
+    # bound the number of in-flight saves (and voxel models held in memory), surfacing failures
+    while pending and (pending[0].done() or len(pending) >= SAVE_WORKERS):
+        pending.popleft().result()
+    pending.append(executor.submit(_finish))
 
     return
 
 
-def _cmd(args: argparse.Namespace, comm: MPI.Intracomm) -> None:
+def _cmd(args: argparse.Namespace, comm: MPI.Intracomm | None) -> None:
     """Command declaration"""
-    return distribute_command_execution(args, comm, _execute_single_sample_id)
+    # overlap writing results with generating the next samples
+    with ThreadPoolExecutor(max_workers=SAVE_WORKERS) as executor:
+        pending: deque[Future] = deque()
+        distribute_command_execution(
+            args,
+            comm,
+            partial(_execute_single_sample_id, executor=executor, pending=pending),
+            process=SamplePaths.synthesis,
+        )
+        # wait for the remaining saves and surface their failures
+        while pending:
+            pending.popleft().result()
+    return
 
 
 def add_parser(subparsers: argparse._SubParsersAction) -> None:
@@ -2,32 +2,61 @@ from __future__ import annotations
 
 import argparse
 import os
+import queue
 import subprocess
-
-from mpi4py import MPI
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ...config.declaration import ProjectConfig, TriangulationConfig
-from ...core.io import load_voxels, save_surface_mesh
-from ...core.meshing.triangulation import triangulate_voxels
-from ...utilities.paths import ProjectPaths
+from ...utilities.paths import ProjectPaths, SamplePaths, fast_resolve
 from ..shared import (
     derive_cli_flags_from_config,
     distribute_command_execution,
     document_command_execution,
+    documentation_enabled,
 )
 
+if TYPE_CHECKING:
+    from mpi4py import MPI
+
 CMD_NAME = "triangulate"
+# number of concurrent background save/BREP export tasks per rank
+BREP_EXPORT_WORKERS = 2
 
 
 def _execute_single_sample_id(
-    paths: ProjectPaths, config: ProjectConfig, sample_id: str, size: int
+    paths: ProjectPaths,
+    config: ProjectConfig,
+    sample_id: str,
+    size: int,
+    executor: ThreadPoolExecutor | None = None,
+    pending: deque[Future] | None = None,
+    exporter: _FreeCADDaemons | None = None,
 ) -> None:
-    """Execute process for a single sample ID"""
+    """Execute process for a single sample ID
+
+    If an executor (and its pending queue) is given, saving, BREP export and documentation
+    run in the background while the caller moves on to the next sample.
+    If an exporter is given, BREP exports go to its long-running FreeCAD processes.
+    """
+    # deferred imports: open3d/skimage are slow to load and only needed here
+    from ...core.io import load_voxels, save_surface_mesh
+    from ...core.meshing.triangulation import triangulate_voxels
+
+    # time the sample (manifest records it for longest-first scheduling of reruns)
+    start_time = time.perf_counter()
+
     # get resolved config
     cmdconfig: TriangulationConfig = config.triangulate
 
-    voxels_path = paths.sample(sample_id).synthesis().require_voxels()
-    voxels = load_voxels(voxels_path)
+    sample = paths.sample(sample_id)
+    voxels_path = sample.synthesis().require_voxels()
+    # read-only access: map the file instead of copying it into each rank
+    voxels = load_voxels(voxels_path, mmap=True)
 
     # generate surface mesh
     surface_mesh, metadata = triangulate_voxels(
@@ -37,58 +66,174 @@ def _execute_single_sample_id(
         cmdconfig.shrinkage_tolerance,
     )
 
-    process_paths = paths.sample(sample_id).triangulation()
+    process_paths = sample.triangulation()
     process_paths.ensure_dir()
     surface_mesh_stl = process_paths.mesh
     surface_mesh_brep = process_paths.brep
 
-    save_surface_mesh(surface_mesh, surface_mesh_stl)
+    def _finish() -> None:
+        """Save the surface mesh, export to BREP if applicable and document the sample"""
+        save_surface_mesh(surface_mesh, surface_mesh_stl)
+
+        if metadata["success"]:
+            if exporter is not None:
+                exporter.export(surface_mesh_stl, surface_mesh_brep)
+            else:
+                _export_brep(cmdconfig, surface_mesh_stl, surface_mesh_brep)
+            metadata["brep_exported"] = True
+        # silently continue if surface mesh was not water tight and manifold
+        else:
+            metadata["brep_exported"] = False
+        if not documentation_enabled(config):
+            return
+
+        document_command_execution(
+            process_paths,
+            config,
+            CMD_NAME,
+            size,
+            sample_id,
+            inputs={"voxel_model": fast_resolve(voxels_path)},
+            outputs={
+                "surface_mesh_stl": fast_resolve(surface_mesh_stl),
+                "surface_mesh_brep": fast_resolve(surface_mesh_brep),
+            },
+            metadata=metadata,
+            elapsed_seconds=time.perf_counter() - start_time,
+        )
+
+    if executor is None or pending is None:
+        _finish()
+        return
+
+    # bound the number of in-flight tasks (and meshes held in memory), surfacing failures
+    while pending and (pending[0].done() or len(pending) >= BREP_EXPORT_WORKERS):
+        pending.popleft().result()
+    pending.append(executor.submit(_finish))
 
-    if metadata["success"]:
-        # save paths as environment variables for FreeCAD to read
-        env = os.environ.copy()
-        env["INPUT_STL"] = os.path.abspath(surface_mesh_stl)
-        env["OUTPUT_BREP"] = os.path.abspath(surface_mesh_brep)
+    return
 
-        # Export to BREP using an external tool (e.g., FreeCAD command line)
-        # Fail loudly if this process fails
-        try:
-            process = subprocess.run(
-                [cmdconfig.freecad_cmd, cmdconfig.freecad_script_path],
-                env=env,
+
+def _export_brep(
+    cmdconfig: TriangulationConfig, surface_mesh_stl: Path, surface_mesh_brep: Path
+) -> None:
+    """Export a surface mesh to BREP by running the FreeCAD script in a subprocess"""
+    # save paths as environment variables for FreeCAD to read
+    env = os.environ.copy()
+    env["INPUT_STL"] = os.path.abspath(surface_mesh_stl)
+    env["OUTPUT_BREP"] = os.path.abspath(surface_mesh_brep)
+
+    # Export to BREP using an external tool (e.g., FreeCAD command line)
+    # Fail loudly if this process fails
+    try:
+        process = subprocess.run(
+            [cmdconfig.freecad_cmd, cmdconfig.freecad_script_path],
+            env=env,
+        )
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"FreeCAD command failed with return code {process.returncode}"
             )
-            if process.returncode != 0:
-                raise RuntimeError(
-                    f"FreeCAD command failed with return code {process.returncode}"
-                )
-        except Exception as exc:
-            raise RuntimeError("Failed to export BREP using FreeCAD") from exc
+    except Exception as exc:
+        raise RuntimeError("Failed to export BREP using FreeCAD") from exc
+    return
 
-        metadata["brep_exported"] = True
-    # silently continue if surface mesh was not water tight and manifold
-    else:
-        metadata["brep_exported"] = False
 
-    document_command_execution(
-        process_paths,
-        config,
-        CMD_NAME,
-        size,
-        sample_id,
-        inputs={"voxel_model": str(voxels_path.expanduser().resolve())},
-        outputs={
-            "surface_mesh_stl": str(surface_mesh_stl.expanduser().resolve()),
-            "surface_mesh_brep": str(surface_mesh_brep.expanduser().resolve()),
-        },
-        metadata=metadata,
-    )
+class _FreeCADDaemons:
+    """Long-running FreeCAD processes that convert STL to BREP on request
 
-    return
+    Processes are started on demand, one per concurrently exporting thread, so the
+    FreeCAD startup is paid once per thread instead of once per sample.
+    """
 
+    def __init__(self, cmdconfig: TriangulationConfig) -> None:
+        self._args = [cmdconfig.freecad_cmd, cmdconfig.freecad_script_path]
+        self._idle: queue.SimpleQueue[subprocess.Popen] = queue.SimpleQueue()
+        self._started: list[subprocess.Popen] = []
 
-def _cmd(args: argparse.Namespace, comm: MPI.Intracomm) -> None:
+    def export(self, surface_mesh_stl: Path, surface_mesh_brep: Path) -> None:
+        """Export a surface mesh to BREP with an idle (or new) FreeCAD process"""
+        try:
+            process = self._idle.get_nowait()
+        except queue.Empty:
+            process = self._start()
+        try:
+            assert process.stdin is not None and process.stdout is not None
+            process.stdin.write(
+                f"{os.path.abspath(surface_mesh_stl)}\t{os.path.abspath(surface_mesh_brep)}\n"
+            )
+            process.stdin.flush()
+            # skip any console output of FreeCAD itself until the reply
+            while True:
+                line = process.stdout.readline()
+                if not line:
+                    raise RuntimeError(
+                        f"FreeCAD daemon exited with return code {process.wait()}"
+                    )
+                if line.startswith("BREP_OK"):
+                    break
+                if line.startswith("BREP_ERROR"):
+                    # the process is still healthy, only this conversion failed
+                    self._idle.put(process)
+                    raise RuntimeError(line.strip())
+        except Exception as exc:
+            raise RuntimeError("Failed to export BREP using FreeCAD") from exc
+        self._idle.put(process)
+        return
+
+    def close(self) -> None:
+        """Stop all started FreeCAD processes"""
+        for process in self._started:
+            try:
+                if process.stdin is not None:
+                    process.stdin.close()  # end of input stops the daemon
+                process.wait(timeout=60)
+            except Exception:
+                process.kill()
+        return
+
+    def _start(self) -> subprocess.Popen:
+        env = os.environ.copy()
+        env["BREP_DAEMON"] = "1"
+        process = subprocess.Popen(
+            self._args,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,  # line buffered requests
+        )
+        self._started.append(process)
+        return process
+
+
+def _cmd(args: argparse.Namespace, comm: MPI.Intracomm | None) -> None:
     """Command declaration"""
-    return distribute_command_execution(args, comm, _execute_single_sample_id)
+    cmdconfig: TriangulationConfig = args.config.triangulate
+    exporter = None if cmdconfig.no_freecad_daemon else _FreeCADDaemons(cmdconfig)
+    # overlap writing/exporting results (FreeCAD runs as a separate process)
+    # with triangulating the next samples
+    try:
+        with ThreadPoolExecutor(max_workers=BREP_EXPORT_WORKERS) as executor:
+            pending: deque[Future] = deque()
+            distribute_command_execution(
+                args,
+                comm,
+                partial(
+                    _execute_single_sample_id,
+                    executor=executor,
+                    pending=pending,
+                    exporter=exporter,
+                ),
+                process=SamplePaths.triangulation,
+            )
+            # wait for the remaining exports and surface their failures
+            while pending:
+                pending.popleft().result()
+    finally:
+        if exporter is not None:
+            exporter.close()
+    return
 
 
 def add_parser(subparsers: argparse._SubParsersAction) -> None:
@@ -2,22 +2,26 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from mpi4py import MPI
-
-from ...core.io import load_surface_mesh, load_voxels
-from ...core.visualization import (
-    visualize_surface_mesh,
-    visualize_volumetric_mesh,
-    visualize_voxels,
-)
 from ...utilities.paths import ProjectPaths, resolve_existing_samples_file
 from ..shared import derive_cli_flags_from_config
 
+if TYPE_CHECKING:
+    from mpi4py import MPI
+
 
-def _cmd(args: argparse.Namespace, comm: MPI.Intracomm) -> None:
+def _cmd(args: argparse.Namespace, comm: MPI.Intracomm | None) -> None:
     """Command to visualize the contents of a file via file extension"""
-    rank = comm.Get_rank()
+    # deferred imports: plotting backends are slow to load and only needed here
+    from ...core.io import load_surface_mesh, load_voxels
+    from ...core.visualization import (
+        visualize_surface_mesh,
+        visualize_volumetric_mesh,
+        visualize_voxels,
+    )
+
+    rank = 0 if comm is None else comm.Get_rank()
 
     paths: ProjectPaths = ProjectPaths(args.config.behavior.storage_root)
     paths.require_base()
@@ -1,35 +1,82 @@
 from __future__ import annotations
 
 import argparse
+import os
+import sys
 import time
-
-from mpi4py import MPI
+from functools import lru_cache
 
 from ..config.declaration import ProjectConfig
 from ..config.helpers import build_project_config
 from ..utilities.log import exit_program_log, setup_logging
-from .commands import mesh, triangulate, visualize
-from .commands.config import copy as config_copy
-from .commands.config import get as config_get
-from .commands.config import init as config_init
-from .commands.config import set as config_set
-from .commands.config import show as config_show
-from .commands.synthesis import uniform as synthesize_uniform
+from . import commands  # command modules are imported lazily on attribute access
 from .shared import (
+    CONFIG_FLAGS,
+    _flag_spec_table,
     assemble_cli_overrides,
+    default_project_config,
     derive_cli_flags_from_config,
     initialize_parsers,
 )
 
-# attempt to facilitate terminal auto completion for cli commands
-try:
-    import argcomplete
-except ImportError:
-    argcomplete = None
+# top-level command names, used to sniff the requested command before parsing
+_COMMAND_NAMES = ("config", "synthesize-uniform", "triangulate", "mesh", "visualize")
+# commands that run serially on a single process and do not need MPI
+_SERIAL_COMMANDS = ("config",)
+# rank variables set by common MPI launchers (Open MPI, MPICH/Hydra, PMIx, MVAPICH, Slurm)
+_LAUNCHER_RANK_VARS = (
+    "OMPI_COMM_WORLD_RANK",
+    "PMI_RANK",
+    "PMIX_RANK",
+    "MV2_COMM_WORLD_RANK",
+    "SLURM_PROCID",
+)
+
 
+def _sniff_subcommand(argv: list[str] | None) -> str | None:
+    """Return the top-level command name in argv, if it is a known one.
 
-def _build_parser() -> argparse.ArgumentParser:
-    """Build the top-level argument parser for the CLI."""
+    The command is the first positional token; values of global options (e.g. a
+    --storage-root path that happens to equal a command name) are skipped.
+    """
+    tokens = sys.argv[1:] if argv is None else argv
+    value_options = _global_options_with_values()
+    expect_value = False
+    for token in tokens:
+        if expect_value:
+            expect_value = False
+        elif token.startswith("-"):
+            # "--option=value" carries its value in the same token
+            expect_value = "=" not in token and token in value_options
+        else:
+            return token if token in _COMMAND_NAMES else None
+    return None
+
+
+@lru_cache(maxsize=1)
+def _global_options_with_values() -> frozenset[str]:
+    """Return the option strings of global flags that consume the following token."""
+    behavior_specs = _flag_spec_table(ProjectConfig).get("behavior", ())
+    return frozenset(CONFIG_FLAGS).union(
+        flag for flag, kwargs in behavior_specs if kwargs.get("action") != "store_true"
+    )
+
+
+def _launcher_rank() -> int:
+    """Return the rank assigned by an MPI launcher without initializing MPI (0 if none)."""
+    for name in _LAUNCHER_RANK_VARS:
+        value = os.environ.get(name)
+        if value is not None and value.isdigit():
+            return int(value)
+    return 0
+
+
+def _build_parser(subcommand: str | None = None) -> argparse.ArgumentParser:
+    """Build the top-level argument parser for the CLI.
+
+    If a subcommand is given (see _sniff_subcommand), only that command is registered;
+    otherwise all commands are, e.g. for --help, tab completion and error messages.
+    """
     # create global parser
     parser = argparse.ArgumentParser(
         prog="mscthesis", description="Master Thesis Command Line Interface"
@@ -39,37 +86,45 @@ def _build_parser() -> argparse.ArgumentParser:
     )  # key must match the name of BehaviorConfig in ProjectConfig
     subparsers = initialize_parsers(parser)
 
+    def _wanted(name: str) -> bool:
+        return subcommand is None or subcommand == name
+
     # === CONFIG COMMANDS ===
     # Wire in config related commands with an umbrella "config" command
-    config_parser = subparsers.add_parser(
-        "config",
-        help="Commands related to project configuration setup and maintenance.",
-    )
-    config_parser.add_argument(
-        "-u",
-        "--user",
-        action="store_true",
-        help="Apply config commands to the user config in the home directory.",
-    )
-    config_subparsers = config_parser.add_subparsers(
-        title="config_commands",
-        dest="config_command",  # store chosen config command in args.config_command
-    )
-    config_subparsers.required = True
-    # wire in possible config <subcommand>
-    config_init.add_parser(config_subparsers)
-    config_show.add_parser(config_subparsers)
-    config_copy.add_parser(config_subparsers)
-    config_get.add_parser(config_subparsers)
-    config_set.add_parser(config_subparsers)
-    # ... add more commands here that act as subcommands of "config ..."
+    if _wanted("config"):
+        config_parser = subparsers.add_parser(
+            "config",
+            help="Commands related to project configuration setup and maintenance.",
+        )
+        config_parser.add_argument(
+            "-u",
+            "--user",
+            action="store_true",
+            help="Apply config commands to the user config in the home directory.",
+        )
+        config_subparsers = config_parser.add_subparsers(
+            title="config_commands",
+            dest="config_command",  # store chosen config command in args.config_command
+        )
+        config_subparsers.required = True
+        # wire in possible config <subcommand>
+        commands.config.init.add_parser(config_subparsers)
+        commands.config.show.add_parser(config_subparsers)
+        commands.config.copy.add_parser(config_subparsers)
+        commands.config.get.add_parser(config_subparsers)
+        commands.config.set.add_parser(config_subparsers)
+        # ... add more commands here that act as subcommands of "config ..."
     # ======================
 
     # === OTHER COMMANDS ===
-    synthesize_uniform.add_parser(subparsers)
-    triangulate.add_parser(subparsers)
-    mesh.add_parser(subparsers)
-    visualize.add_parser(subparsers)
+    if _wanted("synthesize-uniform"):
+        commands.synthesis.uniform.add_parser(subparsers)
+    if _wanted("triangulate"):
+        commands.triangulate.add_parser(subparsers)
+    if _wanted("mesh"):
+        commands.mesh.add_parser(subparsers)
+    if _wanted("visualize"):
+        commands.visualize.add_parser(subparsers)
 
     # ... add more top-level commands here ...
     # either:
@@ -79,32 +134,54 @@ def _build_parser() -> argparse.ArgumentParser:
     #
     # or directly:
     #   <command_module>.add_parser(subparsers) if no umbrella command is needed
+    # and add the command name to _COMMAND_NAMES
 
     return parser
 
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for the CLI."""
-    # handle potential MPI initialization and print info from rank 0
-    comm = MPI.COMM_WORLD
-    rank = comm.Get_rank()
-    size = comm.Get_size()
+    # only load and initialize MPI for compute commands, not for config or help output
+    subcommand = _sniff_subcommand(argv)
+    comm = None
+    rank, size = 0, 1
+    if subcommand is not None and subcommand not in _SERIAL_COMMANDS:
+        try:
+            from mpi4py import MPI
+        except ImportError:
+            MPI = None  # no MPI runtime available: run serially on this process
+
+        # handle potential MPI initialization and print info from rank 0
+        if MPI is not None:
+            comm = MPI.COMM_WORLD
+            rank = comm.Get_rank()
+            size = comm.Get_size()
+    if comm is None and _launcher_rank() != 0:
+        # launched on several processes without MPI: leave the work to the first one,
+        # e.g. so config commands under mpirun do not write the same file concurrently
+        return 0
     is_mpi = size > 1
 
     if is_mpi and rank == 0:
         print(f"MPI entry with {size} processes.", flush=True)
 
-    parser = _build_parser()
+    parser = _build_parser(subcommand)
 
     # Enable tab completion if argcomplete is available (user must run: 'eval "$(register-python-argcomplete mscthesis)"'
-    # in bash per session or add to .bashrc (I did))
-    if argcomplete is not None and rank == 0:
-        argcomplete.autocomplete(parser)
+    # in bash per session or add to .bashrc (I did)). The shell hook sets _ARGCOMPLETE,
+    # so ordinary invocations skip the import altogether
+    if os.environ.get("_ARGCOMPLETE") and rank == 0:
+        try:
+            import argcomplete
+        except ImportError:
+            pass
+        else:
+            argcomplete.autocomplete(parser)
 
     args = parser.parse_args(argv)
 
     # get default config
-    defaults: ProjectConfig = ProjectConfig()
+    defaults: ProjectConfig = default_project_config()
 
     if hasattr(args, "config_command") and args.config_command == "init":
         # execute init command
@@ -114,7 +191,8 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     # if the user has not initialized a config file in their home directory, ask them to:
-    if not defaults.meta.user_config_path.is_file():
+    # plain os.path check, this probe runs on every invocation
+    if not os.path.isfile(defaults.meta.user_config_path):
         if rank == 0:
             print(
                 f"User config file not found at: {defaults.meta.user_config_path}. "
@@ -136,13 +214,15 @@ def main(argv: list[str] | None = None) -> int:
             args.config, overrides=assemble_cli_overrides(args, defaults)
         )  # here config points to a potential CLI passed path
         # overriding args.config to mean the resolved ProjectConfig instance
-        args.config = config  # pass resolved config to args for commands to use
         b = config.behavior
 
         # force quiet mode if command executed with multiple workers (suppress logs on workers)
         if is_mpi:
-            b.quiet = True
-            b.no_log = True if rank != 0 else b.no_log
+            b = b.model_copy(
+                update={"quiet": True, "no_log": True if rank != 0 else b.no_log}
+            )
+            config = config.model_copy(update={"behavior": b})
+        args.config = config  # pass resolved config to args for commands to use
 
         logger = setup_logging(
             b.storage_root / b.log_filename, b.log_level, b.quiet, b.no_log
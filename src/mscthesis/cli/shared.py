@@ -2,22 +2,95 @@ from __future__ import annotations
 
 import argparse
 import ast
+import importlib
+import re
+import json
+import time
+import traceback
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
 
-from mpi4py import MPI
 from tqdm import tqdm
 
 from ..config.declaration import LogLevel, ProjectConfig
-from ..config.helpers import deep_update, dump_resolved_command_config
-from ..utilities.ids import validate_sample_id
+from ..config.helpers import dump_resolved_command_config
+from ..utilities.ids import validate_sample_id, validate_sample_ids
 from ..utilities.manifest import dump_manifest
 from ..utilities.paths import (
     ProcessPathsBase,
     ProjectPaths,
+    SamplePaths,
     resolve_existing_inventories_file,
 )
 
+if TYPE_CHECKING:
+    from mpi4py import MPI
+
+# number of sample IDs handed out per request under dynamic distribution
+DISPATCH_CHUNK_SIZE = 1
+# MPI message tags for dynamic distribution, and progress reports of static distribution
+_TAG_REQUEST = 1
+_TAG_WORK = 2
+_TAG_DONE = 3
+_TAG_FINISHED = 4
+# argparse type per exact default value type; anything else is parsed from its string
+_ARGTYPE_MAP: dict[type, Callable[[str], Any]] = {
+    Path: Path,
+    type(Path()): Path,  # concrete PosixPath / WindowsPath of default values
+    LogLevel: LogLevel,
+    int: int,
+    float: float,
+    str: str,
+}
+# option strings of the global project config file flag
+CONFIG_FLAGS = ("-c", "--config")
+# sentinel for fields without a parsed CLI argument (None is a valid value)
+_MISSING = object()
+# leading characters of values worth handing to json.loads in parse_string_value
+_JSON_LEADING_CHARS = frozenset('-0123456789["{')
+# JSON-only spellings that ast.literal_eval reads differently, these skip the fast path
+_JSON_ONLY_TOKENS = re.compile(r"true|false|null|NaN|Infinity|\\/")
+
+
+@lru_cache(maxsize=None)
+def _project_defaults(config_cls: type[ProjectConfig]) -> ProjectConfig:
+    """Construct the default configuration of the given class once per process."""
+    return config_cls()
+
+
+def default_project_config() -> ProjectConfig:
+    """
+    Get the default (code) project configuration, shared across the CLI setup.
+    Returns:
+        ProjectConfig: The default project configuration.
+    Notes:
+        - Safe to share since configuration models are frozen.
+    """
+    return _project_defaults(ProjectConfig)
+
+
+def lazy_submodules(package: str, names: Iterable[str]) -> Callable[[str], ModuleType]:
+    """
+    Build a module-level __getattr__ that imports the named submodules on first access.
+    Args:
+        package (str): Dotted name of the package, i.e. its __name__.
+        names (Iterable[str]): Submodules to expose lazily.
+    Returns:
+        Callable[[str], ModuleType]: The __getattr__ to assign in the package.
+    Notes:
+        - Keeps the CLI from importing every command module when only one is chosen.
+    """
+    submodules = frozenset(names)
+
+    def __getattr__(name: str) -> ModuleType:
+        if name not in submodules:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        return importlib.import_module(f".{name}", package)
+
+    return __getattr__
+
 
 def initialize_parsers(
     parser: argparse.ArgumentParser,
@@ -32,11 +105,10 @@ def initialize_parsers(
         argparse._SubParsersAction[argparse.ArgumentParser]: The subparsers object for adding commands.
     """
     # add global flags
-    default_config_path = ProjectConfig().meta.project_config_path
+    default_config_path = default_project_config().meta.project_config_path
     # add a flag to specify a project config file path
     parser.add_argument(
-        "-c",
-        "--config",
+        *CONFIG_FLAGS,
         type=Path,
         default=default_config_path,
         help=f"Path to a config JSON file for process overrides (default: {default_config_path}).",
@@ -52,6 +124,58 @@ def initialize_parsers(
     return subparsers
 
 
+def _derive_flag_specs(cmdconfig: Any) -> tuple[tuple[str, dict[str, Any]], ...]:
+    """Derive (flag, add_argument kwargs) specs from a default command configuration.
+    Args:
+        cmdconfig (Any): The default command configuration model instance.
+    Returns:
+        tuple[tuple[str, dict[str, Any]], ...]: The flag specs to register on a parser.
+    """
+    cli_overrides: dict[str, Any] = cmdconfig.model_dump()
+    if not cli_overrides:
+        return ()
+    # missing hints default to "" below, no need to merge with a blank dict
+    cli_hints: dict[str, str] = getattr(cmdconfig, "cli_hints", None) or {}
+
+    specs: list[tuple[str, dict[str, Any]]] = []
+    for key, value in cli_overrides.items():  # passes if empty {}
+        flag = "--" + key.replace("_", "-")
+        if isinstance(value, bool):  # contract to defines bools as store_true flags
+            specs.append(
+                (flag, {"action": "store_true", "help": cli_hints.get(key, "")})
+            )
+        else:
+            # pick sensible type for argparse where possible, else
+            # try to interpret complex types from string
+            argtype = _ARGTYPE_MAP.get(type(value), parse_string_value)
+            specs.append(
+                (
+                    flag,
+                    {"type": argtype, "default": value, "help": cli_hints.get(key, "")},
+                )
+            )
+    return tuple(specs)
+
+
+@lru_cache(maxsize=None)
+def _flag_spec_table(
+    config_cls: type[ProjectConfig],
+) -> dict[str, tuple[tuple[str, dict[str, Any]], ...]]:
+    """Derive the flag specs of every configuration section in a single pass.
+    Args:
+        config_cls (type[ProjectConfig]): The project configuration class to introspect.
+    Returns:
+        dict[str, tuple[tuple[str, dict[str, Any]], ...]]: Flag specs per section name.
+    """
+    # init defaults once and derive specs for every nested config model
+    defaults = _project_defaults(config_cls)
+    return {
+        name: _derive_flag_specs(cmdconfig)
+        for name, cmdconfig in vars(defaults).items()
+        if hasattr(cmdconfig, "model_dump")
+    }
+
+
 def derive_cli_flags_from_config(
     parser: argparse.ArgumentParser, configname: str
 ) -> argparse.ArgumentParser:
@@ -61,44 +185,13 @@ def derive_cli_flags_from_config(
         configname (str): The name of the command configuration in ProjectConfig.
     Returns:
         argparse.ArgumentParser: The updated argument parser with added flags.
+    Notes:
+        - The config introspection runs once for all sections on first use, so building
+            further parsers is a table lookup plus registration.
     """
-    # init defaults and derive dictionary form for cli overrides
-    defaults = ProjectConfig()
     configname = configname.replace("-", "_")  # normalize possible dash usage
-
-    if hasattr(defaults, configname):
-        cmdconfig = getattr(defaults, configname)
-        cli_overrides: dict[str, Any] = cmdconfig.model_dump()
-        cli_hints = {key: "" for key in cli_overrides.keys()}
-        if hasattr(cmdconfig, "cli_hints"):
-            cli_hints = deep_update(cli_hints, cmdconfig.cli_hints)
-
-        for key, value in cli_overrides.items():  # passes if empty {}
-            flag = "--" + key.replace("_", "-")
-            if isinstance(value, bool):  # contract to defines bools as store_true flags
-                parser.add_argument(
-                    flag, action="store_true", help=cli_hints.get(key, "")
-                )
-            else:
-                # pick sensible type for argparse where possible
-                if isinstance(value, Path):
-                    argtype = Path
-                elif isinstance(value, LogLevel):
-                    argtype = LogLevel
-                elif isinstance(value, int):
-                    argtype = int
-                elif isinstance(value, float):
-                    argtype = float
-                elif isinstance(value, str):
-                    argtype = str
-                else:
-                    argtype = (
-                        parse_string_value  # try to interpret complex types from string
-                    )
-                parser.add_argument(
-                    flag, type=argtype, default=value, help=cli_hints.get(key, "")
-                )
-
+    for flag, kwargs in _flag_spec_table(ProjectConfig).get(configname, ()):
+        parser.add_argument(flag, **kwargs)
     return parser
 
 
@@ -116,29 +209,28 @@ def assemble_cli_overrides(
         - Only arguments that differ from the defaults (coded) are included.
         - Supports nested configuration sections but only one level deep.
     """
-    defaults_dict = defaults.model_dump()
-    keys = defaults_dict.keys()
-    args_dict = dict(vars(args))
-    args_keys = args_dict.keys()
+    args_dict = vars(args)
     cli_overrides: dict[str, Any] = {}
 
-    for configkey in ["behavior", args.command]:
-        # assemble subdict for each config section
-        if configkey in keys:
-            cmd_defaults: dict[str, Any] = defaults_dict[configkey]
-            subdict: dict[str, Any] = {}
-            for cmdkey, cmdvalue in cmd_defaults.items():
-                if cmdkey in args_keys:
-                    value = args_dict[cmdkey]
-                    # normalize Path / str comparisons
-                    if isinstance(cmdvalue, Path) and value is not None:
-                        value = Path(value)
-                    # only include if different from defaults
-                    if value != cmdvalue:
-                        subdict[cmdkey] = value
-            # if subdict is not empty, add to cli_overrides
-            if subdict:
-                cli_overrides[configkey] = subdict
+    for configkey in ("behavior", args.command):
+        # only dump the sections the invocation can override, not the whole tree
+        section = getattr(defaults, configkey, None)
+        if section is None or not hasattr(section, "model_dump"):
+            continue
+        subdict: dict[str, Any] = {}
+        for cmdkey, cmdvalue in section.model_dump().items():
+            value = args_dict.get(cmdkey, _MISSING)
+            if value is _MISSING:
+                continue  # no flag for this field on the chosen command
+            # normalize Path / str comparisons
+            if isinstance(cmdvalue, Path) and value is not None:
+                value = Path(value)
+            # only include if different from defaults
+            if value != cmdvalue:
+                subdict[cmdkey] = value
+        # if subdict is not empty, add to cli_overrides
+        if subdict:
+            cli_overrides[configkey] = subdict
 
     return cli_overrides
 
@@ -150,7 +242,17 @@ def parse_string_value(raw: str) -> Any:
         raw (str): The raw string input to interpret.
     Returns:
         Any: The interpreted value, or the original string if interpretation fails.
+    Notes:
+        - Numbers, strings, lists and dicts in JSON syntax take the (C) json fast path;
+            anything else, e.g. tuples or single quotes, falls back to ast.literal_eval.
+        - Inputs containing JSON-only tokens like true/null/NaN skip the fast path, so
+            results match ast.literal_eval, e.g. "[true]" and "true" stay strings.
     """
+    if raw[:1] in _JSON_LEADING_CHARS and not _JSON_ONLY_TOKENS.search(raw):
+        try:
+            return json.loads(raw)
+        except ValueError:
+            pass
     try:
         value = ast.literal_eval(raw)
     except (ValueError, SyntaxError):
@@ -159,39 +261,417 @@ def parse_string_value(raw: str) -> Any:
 
 
 def distribute_command_execution(
-    args: argparse.Namespace, comm: MPI.Intracomm, execute_single_sample_id: Callable
+    args: argparse.Namespace,
+    comm: MPI.Intracomm | None,
+    execute_single_sample_id: Callable,
+    process: Callable[[SamplePaths], ProcessPathsBase] | None = None,
 ) -> None:
-    """Command declaration"""
-    rank = comm.Get_rank()
-    size = comm.Get_size()
-
-    paths: ProjectPaths = ProjectPaths(args.config.behavior.storage_root)
-    paths.require_base()
-    paths.ensure_samples_root()
-    paths.ensure_inventories_root()
-
-    sample_ids = interpret_sample_input(
-        paths,
-        args.sample_input,
-        args.config.behavior.sample_id_digits,
-    )
+    """
+    Distribute the samples of args.sample_input among MPI ranks and execute them.
+    Args:
+        args (argparse.Namespace): The parsed CLI arguments with resolved args.config.
+        comm (MPI.Intracomm | None): The MPI communicator to distribute over, or None to
+            run serially, e.g. when mpi4py is not installed.
+        execute_single_sample_id (Callable): Per-sample worker with signature
+            (paths: ProjectPaths, config: ProjectConfig, sample_id: str, size: int) -> None.
+        process (Callable[[SamplePaths], ProcessPathsBase] | None): Accessor for the process
+            directory the command documents into, e.g. SamplePaths.meshing. If given,
+            behavior.skip_completed drops samples that already completed successfully, and
+            behavior.longest_first hands out samples longest-first according to runtimes
+            recorded by previous runs.
+    Notes:
+        - All batch commands delegate here, so scheduling changes only need to be made once.
+    """
+    rank, size = (0, 1) if comm is None else (comm.Get_rank(), comm.Get_size())
+    # hoist config lookups out of the per-sample loop
+    config: ProjectConfig = args.config
+    behavior = config.behavior
+    if process is not None and behavior.skip_completed and behavior.no_manifest:
+        # completion is read from the manifests, so nothing would ever be skipped
+        raise ValueError("skip_completed requires manifests, but no_manifest is set")
 
-    # early exit if less samples than workers - also cathes the case of zero samples:
-    if rank >= len(sample_ids) or len(sample_ids) == 0:
-        return
+    # resolve the storage root once - all per-sample paths derive from it
+    paths: ProjectPaths = ProjectPaths(behavior.storage_root.expanduser().resolve())
+    # only rank 0 touches the (possibly shared) file system for the roots
+    setup_error: Exception | None = None
+    if rank == 0:
+        try:
+            paths.require_base()
+            paths.ensure_samples_root()
+            paths.ensure_inventories_root()
+        except Exception as exc:
+            setup_error = exc
+    if comm is not None:
+        # doubles as the barrier: no rank proceeds before the roots exist
+        setup_error = comm.bcast(setup_error, root=0)
+    if setup_error is not None:
+        raise setup_error
+    start_time = time.perf_counter()
 
-    # distribute sample IDs among workers
-    assigned_sample_ids = sample_ids[rank::size]
-    if rank == 0 and size > 1:
-        for sample_id in tqdm(assigned_sample_ids, desc="processing samples..."):
-            execute_single_sample_id(paths, args.config, sample_id, size)
+    # only rank 0 reads the (possibly shared) inventory file
+    sample_ids: list[str] | Exception | None = None
+    if rank == 0:
+        try:
+            sample_ids = interpret_sample_input(
+                paths,
+                args.sample_input,
+                behavior.sample_id_digits,
+            )
+            # a rerun: schedule by previous runs, reading each manifest once
+            longest_first = behavior.longest_first and size > 1
+            if process is not None and (behavior.skip_completed or longest_first):
+                manifests = _load_previous_manifests(paths, sample_ids, process)
+                if behavior.skip_completed:
+                    sample_ids = _drop_completed(sample_ids, manifests)
+                if longest_first:
+                    sample_ids = _order_by_previous_runtime(sample_ids, manifests)
+        except Exception as exc:
+            sample_ids = exc  # forward errors so no worker blocks on communication
+
+    assigned_sample_ids: Iterable[str]
+    # collated progress bar of static distribution on rank 0
+    progress: tqdm | None = None
+    report_progress = False
+    # failed samples ("<sample id>: <error>"), reported to and raised by rank 0
+    failures: list[str] = []
+    if size > 2 and not behavior.static_distribution:
+        # dynamic distribution: rank 0 hands out samples on request to the remaining ranks
+        num_workers = size - 1
+        if rank == 0:
+            failures = _dispatch_sample_ids(comm, sample_ids)  # type: ignore[arg-type]
+            if isinstance(sample_ids, Exception):
+                raise sample_ids
+            assigned_sample_ids = ()
+        else:
+            assigned_sample_ids = _request_sample_ids(comm, failures)  # type: ignore[arg-type]
     else:
+        # static distribution: rank 0 scatters each rank its strided share
+        num_workers = size
+        shares: list[list[str] | Exception] | None = None
+        if rank == 0:
+            if isinstance(sample_ids, Exception):
+                shares = [sample_ids] * size
+            else:
+                shares = _partition_sample_ids(sample_ids, size)  # type: ignore[arg-type]
+        if comm is None:
+            assigned_sample_ids = shares[0]  # type: ignore[index]
+        else:
+            assigned_sample_ids = comm.scatter(shares, root=0)
+        if isinstance(assigned_sample_ids, Exception):
+            raise assigned_sample_ids
+        # workers report each finished sample, so rank 0 shows the progress of all ranks
+        report_progress = size > 1
+        if rank == 0 and report_progress:
+            progress = tqdm(
+                total=len(sample_ids),  # type: ignore[arg-type]
+                desc="processing samples...",
+            )
+
+    # execute assigned samples (possibly none) and keep track of the time spent working
+    busy_time = 0.0
+    progress_reports: list[MPI.Request] = []
+    num_finished = 0  # workers that reported the end of their share to rank 0
+    try:
         for sample_id in assigned_sample_ids:
-            execute_single_sample_id(paths, args.config, sample_id, size)
+            sample_start_time = time.perf_counter()
+            failure = None
+            try:
+                execute_single_sample_id(paths, config, sample_id, size)
+            except Exception as exc:
+                if comm is None:
+                    raise
+                # report the failure to rank 0 and keep working
+                failure = f"{sample_id}: {type(exc).__name__}: {exc}"
+                failures.append(failure)
+            busy_time += time.perf_counter() - sample_start_time
+            if progress is not None:
+                num_done, num_new = _receive_progress_reports(comm, failures)  # type: ignore[arg-type]
+                progress.update(1 + num_done)
+                num_finished += num_new
+            elif report_progress:
+                progress_reports.append(
+                    comm.isend(failure, dest=0, tag=_TAG_DONE)  # type: ignore[union-attr]
+                )
+        if report_progress and rank != 0:
+            # rank 0 waits for this message rather than counting samples to a total
+            progress_reports.append(
+                comm.isend(None, dest=0, tag=_TAG_FINISHED)  # type: ignore[union-attr]
+            )
+    except BaseException:
+        # the other ranks would wait forever for this one in the communication below
+        _abort_on_error(comm)
+        raise
+
+    if comm is None:
+        return
+
+    if progress is not None:
+        # wait for the other ranks to finish their shares
+        while num_finished < size - 1:
+            num_done, num_new = _receive_progress_reports(comm, failures, block=True)
+            progress.update(num_done)
+            num_finished += num_new
+        progress.close()
+
+    # collect timings from all ranks: aggregate busy time and makespan
+    elapsed_time = time.perf_counter() - start_time
+    # imported here so registering commands (e.g. for --help) does not load the MPI runtime
+    from mpi4py import MPI
+
+    if progress_reports:
+        MPI.Request.Waitall(progress_reports)
+    total_busy_time = comm.reduce(busy_time, op=MPI.SUM, root=0)
+    makespan = comm.reduce(elapsed_time, op=MPI.MAX, root=0)
+    if rank == 0 and size > 1:
+        load_balance = total_busy_time / (num_workers * makespan) if makespan else 0.0
+        print(
+            f"Finished on {num_workers} workers in {makespan:.3f} s "
+            f"(aggregate busy time: {total_busy_time:.3f} s, load balance: {load_balance:.0%})",
+            flush=True,
+        )
+    if rank == 0 and failures:
+        raise RuntimeError(
+            f"{len(failures)} sample(s) failed:\n" + "\n".join(sorted(failures))
+        )
 
     return
 
 
+def _abort_on_error(comm: MPI.Intracomm | None) -> None:
+    """
+    Abort all ranks after an unhandled error on this one, reporting it first.
+    Args:
+        comm (MPI.Intracomm | None): The MPI communicator, or None when running serially.
+    Notes:
+        - Does nothing for serial runs, where the error is simply raised.
+    """
+    if comm is None or comm.Get_size() == 1:
+        return
+    traceback.print_exc()
+    print(f"Rank {comm.Get_rank()} failed, aborting all ranks.", flush=True)
+    comm.Abort(1)
+
+
+def _receive_progress_reports(
+    comm: MPI.Intracomm, failures: list[str], block: bool = False
+) -> tuple[int, int]:
+    """
+    Receive the reports that workers sent to rank 0 under static distribution.
+    Args:
+        comm (MPI.Intracomm): The MPI communicator, called on rank 0.
+        failures (list[str]): Failures reported with finished samples are appended here.
+        block (bool): Wait for at least one report instead of only taking those already arrived.
+    Returns:
+        int: The number of samples reported as done (successful or failed).
+        int: The number of workers reported as finished with their share.
+    Notes:
+        - Receiving with any tag keeps each worker's reports in the order they were sent.
+    """
+    from mpi4py import MPI
+
+    status = MPI.Status()
+    num_done = num_finished = 0
+    while (block and num_done + num_finished == 0) or comm.iprobe(
+        source=MPI.ANY_SOURCE, tag=MPI.ANY_TAG
+    ):
+        failure = comm.recv(source=MPI.ANY_SOURCE, tag=MPI.ANY_TAG, status=status)
+        if status.Get_tag() == _TAG_FINISHED:
+            num_finished += 1
+            continue
+        num_done += 1
+        if failure is not None:
+            failures.append(failure)
+    return num_done, num_finished
+
+
+def _partition_sample_ids(sample_ids: list[str], size: int) -> list[list[str]]:
+    """
+    Split sample IDs into one strided share per rank.
+    Args:
+        sample_ids (list[str]): The sample IDs to split.
+        size (int): The number of ranks.
+    Returns:
+        list[list[str]]: Exactly size shares (possibly empty) that together cover every sample ID.
+    """
+    return [sample_ids[r::size] for r in range(size)]
+
+
+def _load_previous_manifests(
+    paths: ProjectPaths,
+    sample_ids: list[str],
+    process: Callable[[SamplePaths], ProcessPathsBase],
+) -> dict[str, dict[str, Any]]:
+    """
+    Read the process manifests that previous runs wrote for the given samples.
+    Args:
+        paths (ProjectPaths): The project paths to look up manifests under.
+        sample_ids (list[str]): The sample IDs to read manifests for.
+        process (Callable[[SamplePaths], ProcessPathsBase]): Accessor for the process directory.
+    Returns:
+        dict[str, dict[str, Any]]: Manifest per sample ID; missing or unreadable ones are left out.
+    Notes:
+        - One read per sample on the (possibly shared) file system, so only done on request.
+    """
+    manifests: dict[str, dict[str, Any]] = {}
+    for sample_id in sample_ids:
+        try:
+            manifest = json.loads(
+                process(paths.sample(sample_id)).manifest.read_bytes()
+            )
+        except (OSError, ValueError):
+            continue
+        if isinstance(manifest, dict):
+            manifests[sample_id] = manifest
+    return manifests
+
+
+def _drop_completed(
+    sample_ids: list[str], manifests: dict[str, dict[str, Any]]
+) -> list[str]:
+    """
+    Drop sample IDs that completed successfully in a previous run, according to their manifest.
+    Args:
+        sample_ids (list[str]): The sample IDs to filter.
+        manifests (dict[str, dict[str, Any]]): Previous manifests per sample ID.
+    Returns:
+        list[str]: The sample IDs that still need processing.
+    Notes:
+        - The manifest is written last, so its presence marks a finished sample; samples
+            whose manifest records a failure (success or brep_exported false) are kept.
+    """
+    remaining = [
+        sample_id
+        for sample_id in sample_ids
+        if not _completed(manifests.get(sample_id))
+    ]
+    if len(remaining) < len(sample_ids):
+        print(
+            f"Skipping {len(sample_ids) - len(remaining)} completed samples.",
+            flush=True,
+        )
+    return remaining
+
+
+def _completed(manifest: dict[str, Any] | None) -> bool:
+    """
+    Check whether a manifest exists and records a successful execution.
+    Args:
+        manifest (dict[str, Any] | None): The previous manifest of a sample, if any.
+    Returns:
+        bool: False if there is no manifest or it records a failure.
+    """
+    if manifest is None:
+        return False
+    meta = manifest.get("meta")
+    if not isinstance(meta, dict):
+        meta = {}
+    # commands without these status entries only write a manifest on success
+    return meta.get("success", True) is not False and (
+        meta.get("brep_exported", True) is not False
+    )
+
+
+def _order_by_previous_runtime(
+    sample_ids: list[str], manifests: dict[str, dict[str, Any]]
+) -> list[str]:
+    """
+    Order sample IDs longest-first by the runtime recorded in their previous manifest.
+    Args:
+        sample_ids (list[str]): The sample IDs to order.
+        manifests (dict[str, dict[str, Any]]): Previous manifests per sample ID.
+    Returns:
+        list[str]: The reordered sample IDs.
+    Notes:
+        - Samples without a recorded runtime are unknown and go first, in their original order.
+    """
+
+    def _previous_runtime(sample_id: str) -> float:
+        try:
+            return float(manifests[sample_id]["elapsed_seconds"])
+        except (KeyError, TypeError, ValueError):
+            return float("inf")
+
+    # stable sort: ties (e.g. all unknown) keep their inventory order
+    return sorted(sample_ids, key=_previous_runtime, reverse=True)
+
+
+def _dispatch_sample_ids(
+    comm: MPI.Intracomm,
+    sample_ids: list[str] | Exception,
+    chunk_size: int = DISPATCH_CHUNK_SIZE,
+) -> list[str]:
+    """
+    Serve sample IDs in chunks to worker ranks on request until all workers are released.
+    Args:
+        comm (MPI.Intracomm): The MPI communicator, called on rank 0.
+        sample_ids (list[str] | Exception): The sample IDs to hand out, or an error to forward.
+        chunk_size (int): Number of sample IDs handed out per request.
+    Returns:
+        list[str]: The failures the workers reported along with their requests.
+    Notes:
+        - A worker's request signals completion of its previous chunk, which drives the progress bar.
+        - An empty chunk releases the requesting worker.
+    """
+    from mpi4py import MPI
+
+    status = MPI.Status()
+    num_active_workers = comm.Get_size() - 1
+    position = 0
+    in_progress: dict[int, int] = {}  # worker rank -> size of the chunk it works on
+    failures: list[str] = []
+    progress = (
+        tqdm(total=len(sample_ids), desc="processing samples...")
+        if not isinstance(sample_ids, Exception)
+        else None
+    )
+
+    while num_active_workers > 0:
+        failures.extend(
+            comm.recv(source=MPI.ANY_SOURCE, tag=_TAG_REQUEST, status=status)
+        )
+        worker = status.Get_source()
+        if progress is not None:
+            progress.update(in_progress.pop(worker, 0))
+
+        if isinstance(sample_ids, Exception):
+            chunk: list[str] | Exception = sample_ids
+            num_active_workers -= 1
+        else:
+            chunk = sample_ids[position : position + chunk_size]
+            position += len(chunk)
+            if chunk:
+                in_progress[worker] = len(chunk)
+            else:
+                num_active_workers -= 1
+        comm.send(chunk, dest=worker, tag=_TAG_WORK)
+
+    if progress is not None:
+        progress.close()
+    return failures
+
+
+def _request_sample_ids(comm: MPI.Intracomm, failures: list[str]) -> Iterator[str]:
+    """
+    Request chunks of sample IDs from rank 0 until released with an empty chunk.
+    Args:
+        comm (MPI.Intracomm): The MPI communicator, called on worker ranks.
+        failures (list[str]): Failures of this worker, appended to by the caller; those
+            not yet reported are sent along with the next request.
+    Yields:
+        str: The next sample ID to process.
+    """
+    num_reported = 0
+    while True:
+        comm.send(failures[num_reported:], dest=0, tag=_TAG_REQUEST)
+        num_reported = len(failures)
+        chunk = comm.recv(source=0, tag=_TAG_WORK)
+        if isinstance(chunk, Exception):
+            raise chunk
+        if not chunk:
+            return
+        yield from chunk
+
+
 def interpret_sample_input(
     paths: ProjectPaths, input: str, required_digits: int
 ) -> list[str]:
@@ -202,19 +682,19 @@ def interpret_sample_input(
                      containing multiple sample IDs (one per line).
         required_digits (int): The required length of each sample ID.
     Returns:
-        list[str]: A list of valid sample IDs.
+        list[str]: A list of valid, unique sample IDs.
     """
     sample_ids: list[str] = []
     # check if input has .txt extension or begins with "@"
     if input.startswith("@") or input.endswith(".txt"):
         # expand path
         input_path = resolve_existing_inventories_file(paths, input, ".txt")
-        # read sample IDs from file
+        # read sample IDs from file in one go (one per line, blank lines ignored)
         with open(input_path, "r") as f:
-            for line in f:
-                sample_id = line.strip()
-                if sample_id and validate_sample_id(sample_id, required_digits):
-                    sample_ids.append(sample_id)
+            lines = [line.strip() for line in f.read().splitlines() if line.strip()]
+        # drop repeated IDs (keeping first occurrence order), so no sample is processed twice
+        sample_ids = list(dict.fromkeys(lines))
+        validate_sample_ids(sample_ids, required_digits)
     else:
         # treat input as single sample ID
         sample_id = input.strip()
@@ -223,6 +703,19 @@ def interpret_sample_input(
     return sample_ids
 
 
+def documentation_enabled(config: ProjectConfig) -> bool:
+    """
+    Check whether document_command_execution would write anything for the given config.
+    Args:
+        config (ProjectConfig): The resolved project configuration.
+    Returns:
+        bool: False if both the resolved command config and the manifest are disabled,
+            so callers can skip assembling inputs, outputs and metadata.
+    """
+    behavior = config.behavior
+    return not (behavior.no_cmdconfig and behavior.no_manifest)
+
+
 def document_command_execution(
     process_paths: ProcessPathsBase,
     config: ProjectConfig,
@@ -232,6 +725,7 @@ def document_command_execution(
     inputs: dict[str, str],
     outputs: dict[str, str],
     metadata: dict[str, Any],
+    elapsed_seconds: float | None = None,
 ) -> None:
     """
     Document the execution of a command by dumping the resolved configuration and manifest.
@@ -242,14 +736,19 @@ def document_command_execution(
         inputs (dict[str, str]): A dictionary of input file paths.
         outputs (dict[str, str]): A dictionary of output file paths.
         metadata (dict[str, Any]): Additional metadata about the execution.
+        elapsed_seconds (float | None): Wall time spent on the sample, used to schedule reruns.
         status (str): The status of the execution (e.g., "success", "failure").
     """
+    if not documentation_enabled(config):
+        return  # nothing to document
+    behavior = config.behavior
+
     # optionally dump resolved command-relevant config
-    if not config.behavior.no_cmdconfig:
+    if not behavior.no_cmdconfig:
         dump_resolved_command_config(config, command_name, process_paths.config)
 
     # optionally dump manifest
-    if not config.behavior.no_manifest:
+    if not behavior.no_manifest:
         dump_manifest(
             process_paths.manifest,
             command_name,
@@ -259,5 +758,7 @@ def document_command_execution(
             outputs,
             metadata,
             config.meta.project_version,
+            elapsed_seconds,
+            compact=behavior.compact_json,
         )
     return
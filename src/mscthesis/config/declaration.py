@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, ClassVar
 
+import orjson
 from pydantic import BaseModel
 from pydantic.config import ConfigDict
 
@@ -20,6 +21,7 @@ Each subclass should declare model_config
     - forbid: exposing a non-coded key raises error (good for typos)
     - ignore: silently drop unkown keys
     - allow: keep unknown keys around 
+- frozen makes resolved configs immutable (and hashable); derive changes via model_copy(update=...)
 - json_schema_extra defines
     - expose (bool): should this model be exposed in json files? (user editable)
     - commands (list[str]): what commands depend on these settings? (useful for saving minimal configs)
@@ -28,6 +30,16 @@ Each subclass should declare model_config
 """
 
 
+# === Helpers ===
+
+
+@lru_cache(maxsize=None)
+def schema_extra(cls: type[BaseModel]) -> dict[str, Any]:
+    """Get the json_schema_extra declared in a model's model_config, looked up once per class"""
+    model_config = getattr(cls, "model_config", None) or {}
+    return model_config.get("json_schema_extra") or {}
+
+
 # === Configuration Models ===
 
 
@@ -35,7 +47,9 @@ class MetaConfig(BaseModel):
     """Meta configuration for naming and hardcoded paths"""
 
     model_config = ConfigDict(
-        extra="forbid", json_schema_extra={"expose": False, "commands": []}
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={"expose": False, "commands": []},
     )
 
     project_name: str = "mscthesis"
@@ -65,7 +79,9 @@ class BehaviorConfig(BaseModel):
     """Configuration for behavior related settings"""
 
     model_config = ConfigDict(
-        extra="forbid", json_schema_extra={"expose": True, "commands": []}
+        extra="forbid",
+        frozen=True,
+        json_schema_extra={"expose": True, "commands": []},
     )
 
     storage_root: Path = Path.home() / "coding/master/.treasury"
@@ -74,6 +90,10 @@ class BehaviorConfig(BaseModel):
     no_cmdconfig: bool = False
     no_manifest: bool = False
     no_log: bool = False
+    compact_json: bool = False
+    static_distribution: bool = False
+    skip_completed: bool = False
+    longest_first: bool = False
     log_level: LogLevel = LogLevel.INFO
     log_filename: str = "run.log"
 
@@ -83,6 +103,10 @@ class BehaviorConfig(BaseModel):
     cli_hints: ClassVar[dict[str, str]] = {
         "storage_root": "Path to storage root for I/O actions",
         "quiet": "Flag to store as true and suppress console output",
+        "compact_json": "Flag to write per-sample manifests and configs without indentation",
+        "static_distribution": "Flag to split samples evenly among MPI ranks up front instead of handing them out on request",
+        "skip_completed": "Flag to skip samples whose output manifest records a successful run (e.g. resuming a crashed batch)",
+        "longest_first": "Flag to hand out samples longest-first by the runtimes recorded in their manifests by a previous run",
     }
 
 
@@ -91,6 +115,7 @@ class UniformSynthesisConfig(BaseModel):
 
     model_config = ConfigDict(
         extra="forbid",
+        frozen=True,
         json_schema_extra={"expose": True, "commands": ["synthesize-uniform"]},
     )
 
@@ -120,6 +145,7 @@ class TriangulationConfig(BaseModel):
 
     model_config = ConfigDict(
         extra="forbid",
+        frozen=True,
         json_schema_extra={"expose": True, "commands": ["triangulate"]},
     )
 
@@ -130,6 +156,7 @@ class TriangulationConfig(BaseModel):
     freecad_script_path: str = (
         "/home/andreasstillits/coding/master/src/mscthesis/core/meshing/breping.py"
     )
+    no_freecad_daemon: bool = False
 
     cli_hints: ClassVar[dict[str, str]] = {
         "smoothing_iterations": "Number of smoothing iterations to apply to the mesh",
@@ -137,6 +164,7 @@ class TriangulationConfig(BaseModel):
         "shrinkage_tolerance": "Maximum acceptable shrinkage ratio for area and volume",
         "freecad_cmd": "Command to run FreeCAD in command line mode",
         "freecad_script_path": "Path to the FreeCAD script for BREP export (shipped with mscthesis)",
+        "no_freecad_daemon": "Flag to start FreeCAD once per sample instead of keeping it running for the batch",
     }
 
 
@@ -145,6 +173,7 @@ class MeshingConfig(BaseModel):
 
     model_config = ConfigDict(
         extra="forbid",
+        frozen=True,
         json_schema_extra={"expose": True, "commands": ["mesh"]},
     )
 
@@ -156,6 +185,8 @@ class MeshingConfig(BaseModel):
     minimum_distance: float = 0.05
     maximum_distance: float = 0.2
     inlet_base_resolution_factor: float = 2.0
+    num_threads: int = 1
+    algorithm_3d: int = 1
 
     cli_hints: ClassVar[dict[str, str]] = {
         "boundary_margin_fraction": "Margin fraction for boundary refinement",
@@ -166,6 +197,8 @@ class MeshingConfig(BaseModel):
         "minimum_distance": "Minimum distance for mesh sizing field",
         "maximum_distance": "Maximum distance for mesh sizing field",
         "inlet_base_resolution_factor": "Factor to scale minimum resolution at inlets",
+        "num_threads": "Number of threads gmsh may use per sample (keep at 1 when running many MPI ranks per node)",
+        "algorithm_3d": "Gmsh 3D meshing algorithm (1: Delaunay, 10: HXT, which parallelizes over num_threads)",
     }
 
 
@@ -173,6 +206,8 @@ class MeshingConfig(BaseModel):
 class ProjectConfig(BaseModel):
     """Main project configuration for mscthesis."""
 
+    model_config = ConfigDict(frozen=True)
+
     meta: MetaConfig = MetaConfig()
     behavior: BehaviorConfig = BehaviorConfig()
     synthesize_uniform: UniformSynthesisConfig = UniformSynthesisConfig()
@@ -187,11 +222,7 @@ class ProjectConfig(BaseModel):
         def _recurse(m: BaseModel) -> dict[str, Any] | None:
             """Resolve the BaseModel as a dictionary if marked for exposure"""
             # get exposure status
-            model_config = getattr(m.__class__, "model_config", None)
-            if model_config is None:
-                return None
-            extra = model_config.get("json_schema_extra") or {}
-            exposed = extra.get("expose", False)  # default to False / None
+            exposed = schema_extra(m.__class__).get("expose", False)  # default to False
 
             # if not the top level ProjectConfig, or not marked for exposure, skip
             if m.__class__ != self.__class__ and not exposed:
@@ -214,4 +245,5 @@ class ProjectConfig(BaseModel):
 
     # helper function for printing exposed config in JSON format
     def dump_json(self) -> str:
-        return json.dumps(self._filter_config_for_exposure(), indent=2, default=str)
+        exposed = self._filter_config_for_exposure()
+        return orjson.dumps(exposed, default=str, option=orjson.OPT_INDENT_2).decode()
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
 from pydantic import BaseModel
 
-from .declaration import ProjectConfig
+from .declaration import ProjectConfig, schema_extra
 
 # === Helper Functions ===
 
@@ -25,11 +26,7 @@ def filter_config_for_command(model: BaseModel, command: str) -> dict[str, Any]:
     """
 
     def _recurse(m: BaseModel) -> dict[str, Any] | None:
-        model_config = getattr(m.__class__, "model_config", None)
-        if model_config is None:
-            return None
-        extra = model_config.get("json_schema_extra") or {}
-        commands = extra.get("commands")
+        commands = schema_extra(m.__class__).get("commands")
 
         if commands is not None and command not in commands:
             # this whole model is irrelevant
@@ -59,11 +56,54 @@ def dump_resolved_command_config(
         command (str): The command name whose relevant configuration to dump.
         target_path (Path): The path where the configuration file will be saved.
     """
-    command_config = filter_config_for_command(config, command)
-    target_path.write_text(json.dumps(command_config, indent=2, default=str))
+    target_path.write_text(_resolved_command_config_text(config, command))
     return
 
 
+@lru_cache(maxsize=8)
+def _resolved_command_config_text(config: ProjectConfig, command: str) -> str:
+    """
+    Serialize the configuration relevant to a command, once per (frozen) config and command.
+    Args:
+        config (ProjectConfig): The resolved project configuration.
+        command (str): The command name whose relevant configuration to serialize.
+    Returns:
+        str: The JSON text, identical for every sample of a batch.
+    """
+    # serialize straight from the model with pydantic's (Rust) serializer
+    include = _command_include_mask(config.__class__, command) or {}
+    if config.behavior.compact_json:
+        return config.model_dump_json(include=include)
+    return config.model_dump_json(include=include, indent=2)
+
+
+@lru_cache(maxsize=None)
+def _command_include_mask(cls: type[BaseModel], command: str) -> dict[str, Any] | None:
+    """
+    Derive the pydantic include mask of the fields relevant to a command, mirroring
+    filter_config_for_command on the model classes instead of instances.
+    Args:
+        cls (type[BaseModel]): The configuration model class.
+        command (str): The command to filter for.
+    Returns:
+        dict[str, Any] | None: The include mask, or None if the whole model is irrelevant.
+    """
+    commands = schema_extra(cls).get("commands")
+    if commands is not None and command not in commands:
+        return None  # this whole model is irrelevant
+
+    mask: dict[str, Any] = {}
+    for name, field in cls.model_fields.items():
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            sub_mask = _command_include_mask(annotation, command)
+            if sub_mask:
+                mask[name] = sub_mask
+        else:
+            mask[name] = True
+    return mask
+
+
 def load_config_from_file(path: Path | None) -> dict[str, Any]:
     """
     Load configuration from a JSON file.
@@ -74,28 +114,77 @@ def load_config_from_file(path: Path | None) -> dict[str, Any]:
     """
     if path is None or not path.exists():
         return {}
-    return json.loads(path.read_text(encoding="utf-8"))
+    return orjson.loads(path.read_bytes())
+
+
+def construct_project_config(data: dict[str, Any]) -> ProjectConfig:
+    """
+    Construct a ProjectConfig from a trusted dictionary without pydantic validation.
+    Args:
+        data (dict[str, Any]): The configuration dictionary, e.g. loaded from a config file.
+    Returns:
+        ProjectConfig: The constructed (unvalidated) project configuration.
+    Notes:
+        - Only use for data produced by ProjectConfig.dump_json() (trusted), since values
+            are not coerced, e.g. paths remain strings.
+        - Missing sections and fields fall back to their coded defaults.
+    """
+
+    def _construct(cls: type[BaseModel], values: dict[str, Any]) -> BaseModel:
+        kwargs: dict[str, Any] = {}
+        for name, field in cls.model_fields.items():
+            if name not in values:
+                continue  # model_construct fills in defaults
+            value = values[name]
+            annotation = field.annotation
+            # recurse into nested config models
+            if (
+                isinstance(annotation, type)
+                and issubclass(annotation, BaseModel)
+                and isinstance(value, dict)
+            ):
+                value = _construct(annotation, value)
+            kwargs[name] = value
+        return cls.model_construct(**kwargs)
+
+    return _construct(ProjectConfig, data)  # type: ignore[return-value]
 
 
 def deep_update(base: dict[str, Any], updates: dict[str, Any]) -> dict[str, Any]:
     """
-    Recursively update a nested dictionary with another dictionary.
+    Update a nested dictionary with another dictionary, in place.
     Args:
-        base    (dict[str, Any]): The original dictionary to be updated.
+        base    (dict[str, Any]): The original dictionary to be updated (mutated).
         updates (dict[str, Any]): The dictionary with updates.
     Returns:
-        dict[str, Any]: The updated dictionary.
-    """
-    result = dict(base)
-    # for all keys and values
-    for key, value in updates.items():
-        # if key points to another dictionary, recurse
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_update(result[key], value)
-        # else update value
-        else:
-            result[key] = value
-    return result
+        dict[str, Any]: The updated base dictionary.
+    Notes:
+        - Pass a copy (e.g. copy.deepcopy) if the original base must stay untouched.
+        - Nested dictionaries of updates may end up shared with base.
+    """
+    # walk pairs of (target, updates) dictionaries without recursion or copies
+    stack = [(base, updates)]
+    while stack:
+        target, changes = stack.pop()
+        for key, value in changes.items():
+            current = target.get(key)
+            # if key points to another dictionary, merge into it
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            # else update value
+            else:
+                target[key] = value
+    return base
+
+
+@lru_cache(maxsize=1)
+def _default_config_json() -> str:
+    """
+    Serialize the default (code) configuration once per process.
+    Returns:
+        str: The JSON text of the defaults; values are re-validated by ProjectConfig.
+    """
+    return ProjectConfig().model_dump_json()
 
 
 def build_project_config(
@@ -110,22 +199,21 @@ def build_project_config(
     Returns:
         ProjectConfig: The constructed project configuration.
     """
-    # load default config and translate to dictionary
-    defaults = ProjectConfig()
-    config_dict = defaults.model_dump()
+    # load default config as a fresh dictionary (merged into in place below)
+    config_dict = orjson.loads(_default_config_json())
 
     # update with user config from home directory if present
-    config_dict = deep_update(
+    deep_update(
         config_dict,
         load_config_from_file(
-            defaults.meta.user_config_path
+            Path(config_dict["meta"]["user_config_path"])
         ),  # empty {} if doesnt exist -> no updates
     )
 
     # update with user supplied config file via command line if present
-    config_dict = deep_update(config_dict, load_config_from_file(path))
+    deep_update(config_dict, load_config_from_file(path))
 
     # update with overrides if present
     if overrides:
-        config_dict = deep_update(config_dict, overrides)
+        deep_update(config_dict, overrides)
     return ProjectConfig.model_validate(config_dict)  # raises error if not valid
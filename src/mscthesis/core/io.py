@@ -1,26 +1,37 @@
 from __future__ import annotations
 
+import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import gmsh
 import numpy as np
-import open3d as o3d
 
 from ..utilities.log import log_call
 
+if TYPE_CHECKING:
+    import open3d as o3d
+
+# buffer size for binary writes, large enough to hold typical voxel grids in few syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
 @log_call()
-def load_voxels(file_path: str | Path) -> np.ndarray:
+def load_voxels(file_path: str | Path, mmap: bool = False) -> np.ndarray:
     """
     Load a 3D voxel grid from a .npy file.
 
     Args:
         filepath (str | Path): Path to the .npy file containing the voxel grid.
+        mmap (bool): Memory-map the file read-only instead of reading it into memory.
 
     Returns:
-        np.ndarray: The loaded 3D voxel grid.
+        np.ndarray: The loaded 3D voxel grid, memory-mapped read-only if mmap is set.
+
+    Notes:
+        - Mapped pages are read on demand and shared through the page cache between ranks
+            on a node; only use mmap=True for read-only access while the file is unchanged.
     """
-    voxels = np.load(file_path)
+    voxels = np.load(file_path, mmap_mode="r" if mmap else None)
     return voxels
 
 
@@ -33,7 +44,9 @@ def save_voxels(voxels: np.ndarray, file_path: str | Path) -> None:
         voxels (np.ndarray): 3D numpy array representing the voxel model.
         filename (str | Path): The output filename for the .npy file.
     """
-    np.save(file_path, voxels)
+    # write header and data through one large buffer instead of many small writes
+    with open(file_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        np.lib.format.write_array(f, np.asanyarray(voxels), allow_pickle=False)
     return
 
 
@@ -47,6 +60,9 @@ def load_surface_mesh(file_path: str | Path) -> o3d.geometry.TriangleMesh:
     Returns:
         o3d.geometry.TriangleMesh: The loaded surface mesh.
     """
+    # deferred import: open3d is slow to load and not needed for voxel I/O
+    import open3d as o3d
+
     mesh = o3d.io.read_triangle_mesh(file_path)
     if mesh.is_empty():
         raise IOError(f"Failed to read mesh from {file_path}")
@@ -61,8 +77,61 @@ def save_surface_mesh(mesh: o3d.geometry.TriangleMesh, file_path: str | Path) ->
     Args:
         mesh (o3d.geometry.TriangleMesh): The surface mesh to save.
         file_path (str | Path): The output filename for the mesh file.
+    Notes:
+        - .stl files are encoded as binary STL directly from the mesh arrays and written in
+            a single write, sparing (networked) storage the many small writes of a mesh writer.
+        - open3d only writes other formats to file names, so those are staged in node-local
+            temporary storage and then transferred in a single write.
     """
-    written = o3d.io.write_triangle_mesh(file_path, mesh)
-    if not written:
-        raise IOError(f"Failed to write mesh to {file_path}")
+    target_path = Path(file_path)
+    if target_path.suffix.lower() == ".stl":
+        target_path.write_bytes(_encode_binary_stl(mesh))
+        return
+
+    # deferred import: open3d is slow to load and not needed for voxel or STL I/O
+    import open3d as o3d
+
+    with tempfile.TemporaryDirectory() as staging_dir:
+        staged_path = Path(staging_dir) / target_path.name
+        written = o3d.io.write_triangle_mesh(str(staged_path), mesh)
+        if not written:
+            raise IOError(f"Failed to write mesh to {file_path}")
+        target_path.write_bytes(staged_path.read_bytes())
     return
+
+
+# binary STL layout: 80 byte header, uint32 triangle count, then one record per triangle
+_STL_HEADER = b"binary STL written by mscthesis".ljust(80, b" ")
+_STL_RECORD = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")]
+)
+
+
+def _encode_binary_stl(mesh: o3d.geometry.TriangleMesh) -> bytes:
+    """
+    Encode a triangle mesh as binary STL in memory.
+
+    Args:
+        mesh (o3d.geometry.TriangleMesh): The surface mesh to encode.
+    Returns:
+        bytes: The binary STL file content.
+    """
+    vertices = np.asarray(mesh.vertices)
+    triangles = np.asarray(mesh.triangles)
+    if len(triangles) == 0:
+        raise IOError("Failed to encode mesh as STL: mesh has no triangles")
+
+    corners = vertices[triangles]  # (num_triangles, 3, 3)
+    normals = np.asarray(mesh.triangle_normals)
+    if len(normals) != len(triangles):
+        # unit face normals from the right-handed vertex order
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals = np.divide(
+            normals, lengths, out=np.zeros_like(normals), where=lengths > 0
+        )
+
+    records = np.zeros(len(triangles), dtype=_STL_RECORD)
+    records["normal"] = normals
+    records["vertices"] = corners
+    return _STL_HEADER + np.uint32(len(triangles)).tobytes() + records.tobytes()
@@ -1,9 +1,15 @@
 """
 Convert an STL file to a BRep file using FreeCAD's Python API.
+
+One-shot mode: set INPUT_STL and OUTPUT_BREP.
+Daemon mode: set BREP_DAEMON=1 and write "<stl path>\t<brep path>" lines to stdin; each
+conversion is answered on stdout with a line starting with BREP_OK or BREP_ERROR.
+An empty line or end of input stops the daemon.
 """
 
 from __future__ import annotations
 
+import contextlib
 import os
 import sys
 
@@ -38,7 +44,29 @@ def stl_to_brep(stl_path: str, brep_path: str, tolerance: float = 0.05) -> None:
     print("Exported BRep:", brep_path, flush=True)
 
 
+def serve():
+    # read conversion requests until an empty line or end of input
+    while True:
+        line = sys.stdin.readline().rstrip("\n")
+        if not line:
+            break
+        try:
+            stl, brep = line.split("\t")
+            # keep stdout for protocol replies only
+            with contextlib.redirect_stdout(sys.stderr):
+                stl_to_brep(stl, brep, tolerance=0.05)
+        except Exception as exc:
+            reply = f"BREP_ERROR {type(exc).__name__}: {exc}".replace("\n", " ")
+        else:
+            reply = "BREP_OK"
+        print(reply, flush=True)
+
+
 def main():
+    # amortize the FreeCAD startup over many conversions if requested
+    if os.environ.get("BREP_DAEMON"):
+        serve()
+        return
     # expects environment variables INPUT_STL and OUTPUT_BREP for file names
     stl = os.environ.get("INPUT_STL")
     brep = os.environ.get("OUTPUT_BREP")
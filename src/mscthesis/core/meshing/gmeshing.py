@@ -59,19 +59,20 @@ def _iterative_affine_transformation(
     return count
 
 
-def _get_bbox(entity: list[tuple[int, int]]) -> tuple[np.ndarray, np.ndarray]:
+def _get_bbox(
+    entity: list[tuple[int, int]],
+) -> tuple[tuple[float, float, float], tuple[float, float, float]]:
     """
     Get bounding box of a given entity
     Args:
         entity (list[tuple[int, int]]): [(dim, tag)]
     Returns:
-        tuple[np.ndarray, np.ndarray]: center (3,) and size (3,) of the bounding box
+        tuple[tuple[float, float, float], tuple[float, float, float]]: center and size of
+            the bounding box (plain floats, too small to benefit from numpy arrays)
     """
     xmin, ymin, zmin, xmax, ymax, zmax = gmsh.model.getBoundingBox(*entity[0])
-    bbox_min = np.array([xmin, ymin, zmin])
-    bbox_max = np.array([xmax, ymax, zmax])
-    bbox_center = (bbox_min + bbox_max) / 2
-    bbox_size = bbox_max - bbox_min
+    bbox_center = ((xmin + xmax) / 2, (ymin + ymax) / 2, (zmin + zmax) / 2)
+    bbox_size = (xmax - xmin, ymax - ymin, zmax - zmin)
     return bbox_center, bbox_size
 
 
@@ -102,9 +103,10 @@ def build_gmsh_model(
     # perform 2D meshing and extract the point furthest away from origin in xy-plane
     gmsh.model.mesh.generate(2)
     node_tags, node_coords, _ = gmsh.model.mesh.getNodes()
-    node_coords = np.array(node_coords).reshape(-1, 3)
-    distances = np.linalg.norm(node_coords[:, :2], axis=1)
-    max_distance = np.max(distances)
+    node_coords = np.asarray(node_coords, dtype=np.float64).reshape(-1, 3)
+    # compare squared radii and take a single square root of the maximum
+    squared_radii = node_coords[:, 0] ** 2 + node_coords[:, 1] ** 2
+    max_distance = float(np.sqrt(squared_radii.max()))
 
     # calculate cylinder geometry
     center, size = _get_bbox(entities)
@@ -132,20 +134,18 @@ def build_gmsh_model(
 
     # Retain only the largest volume as airspace
     volumes = gmsh.model.getEntities(dim=3)
-    largest_volume = 0
-    largest_volume_tag = None
+    if not volumes:
+        raise ValueError("Boolean cut of the cylinder plug left no airspace volume.")
     # identify largest volume
-    for dim, tag in volumes:
-        mass = kernel.getMass(dim, tag)
-        if mass > largest_volume:
-            largest_volume = mass
-            largest_volume_tag = tag
-    # remove all other volumes
-    for dim, tag in volumes:
-        if tag != largest_volume_tag:
-            kernel.remove(
-                [(dim, tag)]
-            )  # recurvsive=True will remove all lower dimensional entities shared at the boundary
+    masses = np.array([kernel.getMass(dim, tag) for dim, tag in volumes])
+    largest = int(np.argmax(masses))
+    largest_volume_tag = volumes[largest][1]
+    # remove all other volumes in one call
+    others = volumes[:largest] + volumes[largest + 1 :]
+    if others:
+        kernel.remove(
+            others
+        )  # recurvsive=True will remove all lower dimensional entities shared at the boundary
 
     kernel.synchronize()
     airspace = [(3, largest_volume_tag)]
@@ -221,44 +221,38 @@ def assign_physical_groups(
         3 * (a + b) - np.sqrt((3 * a + b) * (a + 3 * b))
     )  # approximation of ellipse circumference to account for slight transform assymetry
 
-    curved_area_found = []
-    curved_area_tag = None
-    top_area_tag = None
-    bottom_area_tag = None
-
-    def _iscurved(tag: int) -> bool:
-        area = kernel.getMass(2, tag)
-        trigger = abs(area / curved_area_target - 1) <= tolerance
-        if trigger:
-            curved_area_found.append(area)
-        return trigger
-
     # airspace
     gmsh.model.addPhysicalGroup(3, [tag for dim, tag in airspace], 1, name="airspace")
 
     # ====== surfaces ======
     # get all surfaces
     surfaces = gmsh.model.getEntities(dim=2)
+    surface_tags = np.array([tag for dim, tag in surfaces], dtype=np.int64)
 
-    mesophyll_surface_tags = []
-    for dim, tag in surfaces:
-        com = gmsh.model.occ.getCenterOfMass(dim, tag)
-        if np.isclose(com[2], 1.0):
-            # top surface
-            gmsh.model.addPhysicalGroup(2, [tag], 2, name="top_surface")
-            top_area_tag = tag
-        elif np.isclose(com[2], 0.0):
-            # bottom surface
-            gmsh.model.addPhysicalGroup(2, [tag], 3, name="bottom_surface")
-            bottom_area_tag = tag
-        elif _iscurved(tag):
-            # curved surface of cylinder
-            gmsh.model.addPhysicalGroup(2, [tag], 4, name="curved_surface")
-            curved_area_tag = tag
-        else:
-            # other surfaces
-            mesophyll_surface_tags.append(tag)
+    # query each face once: z-coordinate of its center of mass, and its area only where
+    # needed to tell the curved face apart from the mesophyll surfaces
+    com_z = np.array(
+        [kernel.getCenterOfMass(2, int(tag))[2] for tag in surface_tags], dtype=float
+    )
+    is_top = np.isclose(com_z, 1.0)
+    is_bottom = np.isclose(com_z, 0.0) & ~is_top
+    areas = np.full(len(surface_tags), np.nan)  # nan never classifies as curved
+    for i in np.flatnonzero(~(is_top | is_bottom)):
+        areas[i] = kernel.getMass(2, int(surface_tags[i]))
+    is_curved = np.abs(areas / curved_area_target - 1) <= tolerance
+    is_mesophyll = ~(is_top | is_bottom | is_curved)
+
+    # classify surfaces into physical groups
+    top_area_tag = _assign_surface_group(surface_tags[is_top], 2, "top_surface")
+    bottom_area_tag = _assign_surface_group(
+        surface_tags[is_bottom], 3, "bottom_surface"
+    )
+    curved_area_tag = _assign_surface_group(
+        surface_tags[is_curved], 4, "curved_surface"
+    )
+    mesophyll_surface_tags = surface_tags[is_mesophyll].tolist()
     gmsh.model.addPhysicalGroup(2, mesophyll_surface_tags, 5, name="mesophyll_surfaces")
+    curved_area_found = areas[is_curved].tolist()
 
     assert (
         len(curved_area_found) == 1
@@ -278,6 +272,22 @@ def assign_physical_groups(
     return tags
 
 
+def _assign_surface_group(tags: np.ndarray, group_tag: int, name: str) -> int | None:
+    """
+    Add the given surfaces as a physical group if any were identified.
+    Args:
+        tags (np.ndarray): Tags of the identified surfaces.
+        group_tag (int): Tag of the physical group.
+        name (str): Name of the physical group.
+    Returns:
+        int | None: The (last) identified surface tag, or None if there is none.
+    """
+    if len(tags) == 0:
+        return None
+    gmsh.model.addPhysicalGroup(2, tags.tolist(), group_tag, name=name)
+    return int(tags[-1])
+
+
 @log_call()
 def configure_meshfield(
     tags: dict[str, Any],
@@ -343,15 +353,23 @@ def run_gmsh_session(
     minimum_distance: float,
     maximum_distance: float,
     inlet_base_resolution_factor: float,
+    num_threads: int = 1,
+    algorithm_3d: int = 1,
 ) -> dict[str, Any]:
     """
     Run the gmsh meshing session.
     Args:
         brep_file (str | Path): Path to the input BREP file.
         output_mesh_file (str | Path): Path to the output mesh file.
+        num_threads (int): Number of threads gmsh may use for meshing.
+        algorithm_3d (int): Gmsh 3D meshing algorithm, e.g. 1 (Delaunay) or 10 (HXT).
+    Notes:
+        - Only HXT parallelizes the 3D step; num_threads otherwise speeds up 1D/2D meshing.
     """
     _silent_initialize()
     gmsh.option.setNumber("Geometry.OCCBoundsUseStl", 1)
+    gmsh.option.setNumber("General.NumThreads", num_threads)
+    gmsh.option.setNumber("Mesh.Algorithm3D", algorithm_3d)
     gmsh.model.add("Leaf Plug Model")
     entities = kernel.importShapes(str(brep_file))
     kernel.synchronize()
@@ -12,7 +12,7 @@ from ...utilities.log import log_call
 def _clean_mesh(mesh: o3d.geometry.TriangleMesh) -> o3d.geometry.TriangleMesh:
     """
     Clean the mesh by removing degenerate triangles, duplicated vertices,
-    and non-manifold edges.
+    and non-manifold edges. Vertex normals are not computed here.
 
     Args:
         mesh (o3d.geometry.TriangleMesh): The input mesh to be cleaned.
@@ -25,16 +25,40 @@ def _clean_mesh(mesh: o3d.geometry.TriangleMesh) -> o3d.geometry.TriangleMesh:
     mesh.remove_degenerate_triangles()
     mesh.remove_unreferenced_vertices()
     mesh.remove_non_manifold_edges()
-    mesh.compute_vertex_normals()
     return mesh
 
 
+def _area_volume(
+    vertices: np.ndarray, triangles: np.ndarray, closed: bool
+) -> tuple[float, float | None]:
+    """
+    Compute surface area and enclosed volume of a triangle mesh in one pass.
+
+    Args:
+        vertices (np.ndarray): (V, 3) array of vertex coordinates.
+        triangles (np.ndarray): (F, 3) array of vertex indices per triangle.
+        closed (bool): Whether the mesh is watertight; the volume is only defined if so.
+
+    Returns:
+        float: Surface area.
+        float | None: Enclosed volume, or None if the mesh is not closed.
+    """
+    a, b, c = (vertices[triangles[:, i]] for i in range(3))
+    cross = np.cross(b - a, c - a)
+    area = 0.5 * np.linalg.norm(cross, axis=1).sum()
+    if not closed:
+        return float(area), None
+    # divergence theorem: sum of signed tetrahedron volumes spanned with the origin
+    volume = np.einsum("ij,ij->", a, cross) / 6.0
+    return float(area), float(abs(volume))
+
+
 def _metadata(
     mesh: o3d.geometry.TriangleMesh,
     pre_area: float,
     post_area: float,
-    pre_volume: float,
-    post_volume: float,
+    pre_volume: float | None,
+    post_volume: float | None,
     shrinkage_tolerance: float,
     success: bool,
 ) -> dict[str, Any]:
@@ -45,21 +69,26 @@ def _metadata(
         mesh (o3d.geometry.TriangleMesh): The triangulated mesh.
         pre_area (float): Surface area before processing.
         post_area (float): Surface area after processing.
-        pre_volume (float): Volume before processing.
-        post_volume (float): Volume after processing.
+        pre_volume (float | None): Volume before processing, None if undefined.
+        post_volume (float | None): Volume after processing, None if undefined.
         shrinkage_tolerance (float): Tolerance for acceptable shrinkage.
         status (str): Status of the triangulation process.
 
     Returns:
         dict[str, Any]: Metadata dictionary.
     """
-    num_vertices = len(np.asarray(mesh.vertices))
-    num_faces = len(np.asarray(mesh.triangles))
+    num_vertices = len(mesh.vertices)
+    num_faces = len(mesh.triangles)
 
     area_shrinkage = abs(pre_area - post_area) / pre_area
-    volume_shrinkage = abs(pre_volume - post_volume) / pre_volume
-    shrinkage_acceptable = (area_shrinkage <= shrinkage_tolerance) and (
-        volume_shrinkage <= shrinkage_tolerance
+    # volumes are undefined for meshes that are not watertight
+    volume_shrinkage = None
+    if pre_volume is not None and post_volume is not None:
+        volume_shrinkage = abs(pre_volume - post_volume) / pre_volume
+    shrinkage_acceptable = (
+        area_shrinkage <= shrinkage_tolerance
+        and volume_shrinkage is not None
+        and volume_shrinkage <= shrinkage_tolerance
     )
 
     return {
@@ -83,6 +112,7 @@ def triangulate_voxels(
     decimation_target: int = 10_000,
     shrinkage_tolerance: float = 0.10,
     spacing: Iterable[float] = (1.0, 1.0, 1.0),
+    compute_normals: bool = False,
 ) -> tuple[o3d.geometry.TriangleMesh, dict[str, Any]]:
     """
     Triangulate a voxel model using the marching cubes algorithm.
@@ -90,46 +120,50 @@ def triangulate_voxels(
     Args:
         voxels (np.ndarray): 3D numpy array of shape (X, Y, Z) with binary values,
             where 1 indicates presence of tissue and 0 indicates airspace.
+        compute_normals (bool): Whether to compute vertex normals on the final mesh,
+            e.g. for shading. Not needed for the metadata or for saving.
 
     Returns:
         o3d.geometry.TriangleMesh: The triangulated mesh.
         dict: Metadata including number of vertices and faces.
     """
-    # apply marching cubes algorithm
-    verts, faces, normals, values = measure.marching_cubes(
-        voxels, spacing=spacing, level=0.5
+    # apply marching cubes algorithm (shares vertices, degenerate faces dropped)
+    verts, faces, _, _ = measure.marching_cubes(
+        voxels, spacing=spacing, level=0.5, allow_degenerate=False
     )
     mesh = o3d.geometry.TriangleMesh()
     mesh.vertices = o3d.utility.Vector3dVector(verts)
     mesh.triangles = o3d.utility.Vector3iVector(faces)
-    mesh = _clean_mesh(mesh)
 
     # get surface area and volume
-    pre_area = mesh.get_surface_area()
-    pre_volume = mesh.get_volume()
+    pre_area, pre_volume = _area_volume(verts, faces, mesh.is_watertight())
 
-    # apply smoothing
+    # apply smoothing (moves vertices only, topology is unchanged)
     mesh = mesh.filter_smooth_taubin(number_of_iterations=smoothing_iterations)
-    mesh = _clean_mesh(mesh)
 
     # apply mesh decimation
-    current_triangle_count = len(np.asarray(mesh.triangles))
+    current_triangle_count = len(mesh.triangles)
     target_triangle_count = decimation_target
     if target_triangle_count < current_triangle_count:
         mesh = mesh.simplify_quadric_decimation(
             target_number_of_triangles=target_triangle_count
         )
-        mesh = _clean_mesh(mesh)
 
-    # get post-processing area and volume
-    post_area = mesh.get_surface_area()
-    post_volume = mesh.get_volume()
+    # clean once, after all stages that may change the topology
+    mesh = _clean_mesh(mesh)
+    if compute_normals:
+        mesh.compute_vertex_normals()
 
     # check that mesh is manifold and water tight
     is_edge_manifold = mesh.is_edge_manifold()
     is_vertex_manifold = mesh.is_vertex_manifold()
     is_watertight = mesh.is_watertight()
 
+    # get post-processing area and volume
+    post_area, post_volume = _area_volume(
+        np.asarray(mesh.vertices), np.asarray(mesh.triangles), is_watertight
+    )
+
     success = is_edge_manifold and is_vertex_manifold and is_watertight
 
     metadata = _metadata(
@@ -35,12 +35,16 @@ def initialize_meshgrid(
     Returns:
         tuple[np.ndarray, tuple[np.ndarray, np.ndarray, np.ndarray]]:
             A tuple containing the empty voxel grid and the meshgrid arrays (X, Y, Z).
+
+    Notes:
+        - X, Y, Z are sparse, i.e. of shapes (N, 1, 1), (1, N, 1) and (1, 1, Nz), and broadcast
+            to the full grid in arithmetic instead of each holding a dense copy of it.
     """
     planar_resolution = int(2 * plug_aspect * resolution)
     x = np.linspace(-plug_aspect, plug_aspect, planar_resolution)
     y = np.linspace(-plug_aspect, plug_aspect, planar_resolution)
     z = np.linspace(0, 1, resolution)
-    X, Y, Z = np.meshgrid(x, y, z, indexing="ij")
+    X, Y, Z = np.meshgrid(x, y, z, indexing="ij", sparse=True)
 
     # initialize empty voxels
     voxels = np.zeros(
@@ -34,13 +34,13 @@ def _metadata(
     metadata["mean_radius"] = float(np.mean(radii)) if len(radii) > 0 else 0.0
     metadata["max_radius"] = float(np.max(radii)) if len(radii) > 0 else 0.0
     metadata["mean_cell_volume"] = (
-        float(np.mean([(4 / 3) * np.pi * r**3 for r in radii]))  # type: ignore
-        if len(radii) > 0
-        else 0.0
+        float((4 / 3) * np.pi * np.mean(radii**3)) if len(radii) > 0 else 0.0
     )
-    metadata["mean_porosity"] = 1.0 - float(np.sum(voxels) / voxels.size)
+    # tissue voxels per z-slice, reduced once and reused for both porosity statistics
+    slice_tissue = np.sum(voxels, axis=(0, 1), dtype=np.int64)
+    metadata["mean_porosity"] = 1.0 - float(slice_tissue.sum() / voxels.size)
     metadata["std_porosity"] = float(
-        np.std(1.0 - np.sum(voxels, axis=(0, 1)) / (voxels.shape[0] * voxels.shape[1]))
+        np.std(1.0 - slice_tissue / (voxels.shape[0] * voxels.shape[1]))
     )
     metadata["success"] = True
     return metadata
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
 from .log import log_call
 
 
+@lru_cache(maxsize=8)
+def _sample_id_pattern(required_digits: int) -> re.Pattern[str]:
+    """Compiled pattern matching exactly `required_digits` ASCII digits."""
+    return re.compile(rf"[0-9]{{{required_digits}}}")
+
+
 @log_call()
 def validate_sample_id(sample_id: str, required_digits: int) -> bool:
     """
@@ -19,12 +28,29 @@ def validate_sample_id(sample_id: str, required_digits: int) -> bool:
             f"Sample ID '{sample_id}' does not match required "
             f"length of {required_digits} digits."
         )
-    # if not mappable to int
-    try:
-        int(sample_id)
-    except Exception as exc:
-        raise ValueError(
-            f"Sample ID '{sample_id}' is not a valid integer string."
-        ) from exc
+    # if not all digits
+    if _sample_id_pattern(required_digits).fullmatch(sample_id) is None:
+        raise ValueError(f"Sample ID '{sample_id}' is not a valid integer string.")
+
+    return True
 
+
+@log_call()
+def validate_sample_ids(sample_ids: list[str], required_digits: int) -> bool:
+    """
+    Validate many sample IDs at once, e.g. from an inventory file.
+    Args:
+        sample_ids (list[str]): The sample IDs to validate.
+        required_digits (int): The required length of each sample ID.
+    Raises:
+        ValueError: For the first sample ID that does not match the required length.
+    """
+    pattern = _sample_id_pattern(required_digits)
+    # one C-level pass over all IDs, only fall back to the detailed check for an offender
+    invalid = next(
+        (sample_id for sample_id in sample_ids if pattern.fullmatch(sample_id) is None),
+        None,
+    )
+    if invalid is not None:
+        validate_sample_id(invalid, required_digits)  # raises the precise error
     return True
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import json
 import subprocess
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .log import log_call
 
 
@@ -19,6 +21,8 @@ def dump_manifest(
     outputs: dict[str, Any],
     metadata: dict[str, Any],
     tool_version: str,
+    elapsed_seconds: float | None = None,
+    compact: bool = False,
 ) -> None:
     """
     Dump a manifest JSON file summarizing the command execution and output contents.
@@ -31,27 +35,57 @@ def dump_manifest(
         metadata (dict[str, Any]): Additional metadata to include in the manifest.
         success (bool): Status of the command execution.
         tool_version (str): Version of the tool used.
+        elapsed_seconds (float | None): Wall time spent on the sample, recorded if given.
+        compact (bool): Write without indentation, e.g. for large batches.
     """
     manifest: dict[str, Any] = {}
     manifest["execution_time"] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
     manifest["command"] = command_name
     manifest["num_processes"] = num_processes
     manifest["sample_id"] = sample_id
+    if elapsed_seconds is not None:
+        manifest["elapsed_seconds"] = round(elapsed_seconds, 3)
     manifest["inputs"] = inputs
     manifest["outputs"] = outputs
     manifest["meta"] = metadata
+    manifest["git_commit"] = _git_commit()
+    manifest["tool"] = f"mscthesis version {tool_version}"
+
+    # serialize in memory and write in one go
+    target_path.write_bytes(_encode_manifest(manifest, compact))
+
+    return
+
+
+def _encode_manifest(manifest: dict[str, Any], compact: bool) -> bytes:
+    """
+    Encode a manifest as UTF-8 JSON with orjson.
+    Args:
+        manifest (dict[str, Any]): The manifest to encode.
+        compact (bool): Encode without indentation.
+    Returns:
+        bytes: The encoded manifest.
+    Notes:
+        - numpy scalars/arrays in metadata are written as JSON numbers, not strings.
+    """
+    option = orjson.OPT_SERIALIZE_NUMPY
+    if not compact:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(manifest, default=str, option=option)
+
+
+@lru_cache(maxsize=1)
+def _git_commit() -> str:
+    """
+    Get the current git commit hash, looked up once per process.
+    Returns:
+        str: The commit hash, or "unknown" if it cannot be determined.
+    """
     try:
-        git_commit = (
+        return (
             subprocess.check_output(["git", "rev-parse", "HEAD"])
             .decode("utf-8")
             .strip()
         )
     except Exception:
-        git_commit = "unknown"
-    manifest["git_commit"] = git_commit
-    manifest["tool"] = f"mscthesis version {tool_version}"
-
-    with open(target_path, "w") as manifest_file:
-        json.dump(manifest, manifest_file, indent=2, default=str)
-
-    return
+        return "unknown"
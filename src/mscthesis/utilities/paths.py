@@ -30,9 +30,29 @@ Write from sample id:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 
+# ===== Formatting helpers =====
+
+
+def fast_resolve(path: Path) -> str:
+    """
+    Return an absolute string form of a path, e.g. for recording in manifests.
+    Already absolute paths are only normalized lexically, avoiding the filesystem
+    lookups of Path.resolve(); symlinks are therefore not canonicalized.
+    Args:
+        path (Path): The path to format.
+    Returns:
+        str: The absolute path as a string.
+    """
+    s = os.fspath(path)
+    if os.path.isabs(s) and "~" not in s:
+        return os.path.normpath(s)
+    return str(path.expanduser().resolve())
+
+
 # ===== Require helpers (pure checks, no creation) =====
 
 
@@ -44,11 +64,12 @@ def require_dir(path: Path) -> Path:
     Returns:
         Path: The verified directory path.
     """
+    # single stat in the common case, classify the failure only if needed
+    if path.is_dir():
+        return path
     if not path.exists():
         raise FileNotFoundError(f"Directory does not exist: {path}")
-    if not path.is_dir():
-        raise NotADirectoryError(f"Path is not a directory: {path}")
-    return path
+    raise NotADirectoryError(f"Path is not a directory: {path}")
 
 
 def require_file(path: Path) -> Path:
@@ -59,11 +80,12 @@ def require_file(path: Path) -> Path:
     Returns:
         Path: The verified file path.
     """
+    # single stat in the common case, classify the failure only if needed
+    if path.is_file():
+        return path
     if not path.exists():
         raise FileNotFoundError(f"File does not exist: {path}")
-    if not path.is_file():
-        raise IsADirectoryError(f"Path is not a file: {path}")
-    return path
+    raise IsADirectoryError(f"Path is not a file: {path}")
 
 
 def require_extension(path: Path, *valid_extensions: str) -> Path:
@@ -88,21 +110,27 @@ def require_extension(path: Path, *valid_extensions: str) -> Path:
 # ===== Ensure helper (creation if missing) =====
 
 
-def ensure_dir(path: Path) -> Path:
+def ensure_dir(path: Path, ensured: set[Path] | None = None) -> Path:
     """
     Ensure that the given path exists as a directory, creating it if necessary.
     Args:
         path (Path): The directory path to ensure.
+        ensured (set[Path] | None): Directories already ensured by the caller, skipped
+            without touching the filesystem; the path is added once ensured.
     Raises:
         NotADirectoryError: If the path exists but is not a directory.
     Returns:
         Path: The ensured directory path.
     """
+    if ensured is not None and path in ensured:
+        return path
     if path.exists():
         if not path.is_dir():
             raise NotADirectoryError(f"Path exists but is not a directory: {path}")
-        return path
-    path.mkdir(parents=True, exist_ok=True)
+    else:
+        path.mkdir(parents=True, exist_ok=True)
+    if ensured is not None:
+        ensured.add(path)
     return path
 
 
@@ -207,6 +235,13 @@ def resolve_existing_inventories_file(
 @dataclass(frozen=True)
 class ProjectPaths:
     base: Path
+    _samples: dict[str, SamplePaths] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # directories ensured through this instance - skips repeated stat/mkdir in batch runs
+    _ensured: set[Path] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
 
     @property
     def samples(self) -> Path:
@@ -217,7 +252,10 @@ class ProjectPaths:
         return self.base / "inventories"
 
     def sample(self, sample_id: str) -> SamplePaths:
-        return SamplePaths(self, sample_id)
+        # memoize per sample ID, batch commands request the same sample repeatedly
+        if sample_id not in self._samples:
+            self._samples[sample_id] = SamplePaths(self, sample_id)
+        return self._samples[sample_id]
 
     # verification
     def require_base(self) -> Path:
@@ -225,11 +263,11 @@ class ProjectPaths:
 
     def ensure_samples_root(self) -> Path:
         self.require_base()
-        return ensure_dir(self.samples)
+        return ensure_dir(self.samples, self._ensured)
 
     def ensure_inventories_root(self) -> Path:
         self.require_base()
-        return ensure_dir(self.inventories)
+        return ensure_dir(self.inventories, self._ensured)
 
 
 @dataclass(frozen=True)
@@ -258,7 +296,7 @@ class SamplePaths:
 
     def ensure_dir(self) -> Path:
         self.paths.ensure_samples_root()
-        return ensure_dir(self.dir)
+        return ensure_dir(self.dir, self.paths._ensured)
 
 
 @dataclass(frozen=True)
@@ -284,18 +322,22 @@ class ProcessPathsBase:
         return require_dir(self.dir)
 
     def require_config(self) -> Path:
-        self.require_dir()
-        require_file(self.config)
-        return require_extension(self.config, ".json")
+        return self._require_file(self.config, ".json")
 
     def require_manifest(self) -> Path:
-        self.require_dir()
-        require_file(self.manifest)
-        return require_extension(self.manifest, ".json")
+        return self._require_file(self.manifest, ".json")
+
+    def _require_file(self, path: Path, *valid_extensions: str) -> Path:
+        # an existing file implies its directories exist: one stat in the common case,
+        # and only walk up the directories to report which part is missing
+        if not path.is_file():
+            self.require_dir()
+            require_file(path)
+        return require_extension(path, *valid_extensions)
 
     def ensure_dir(self) -> Path:
         self.sample.ensure_dir()
-        return ensure_dir(self.dir)
+        return ensure_dir(self.dir, self.sample.paths._ensured)
 
 
 @dataclass(frozen=True)
@@ -307,9 +349,7 @@ class SynthesisPaths(ProcessPathsBase):
         return self.dir / "voxels.npy"
 
     def require_voxels(self) -> Path:
-        self.require_dir()
-        require_file(self.voxels)
-        return require_extension(self.voxels, ".npy")
+        return self._require_file(self.voxels, ".npy")
 
 
 @dataclass(frozen=True)
@@ -325,14 +365,10 @@ class TriangulationPaths(ProcessPathsBase):
         return self.dir / "surface_mesh.brep"
 
     def require_mesh(self) -> Path:
-        self.require_dir()
-        require_file(self.mesh)
-        return require_extension(self.mesh, ".stl")
+        return self._require_file(self.mesh, ".stl")
 
     def require_brep(self) -> Path:
-        self.require_dir()
-        require_file(self.brep)
-        return require_extension(self.brep, ".brep")
+        return self._require_file(self.brep, ".brep")
 
 
 @dataclass(frozen=True)
@@ -344,6 +380,4 @@ class MeshingPaths(ProcessPathsBase):
         return self.dir / "volumetric_mesh.msh"
 
     def require_mesh(self) -> Path:
-        self.require_dir()
-        require_file(self.mesh)
-        return require_extension(self.mesh, ".msh")
+        return self._require_file(self.mesh, ".msh")
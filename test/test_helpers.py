@@ -1,7 +1,9 @@
 import copy
+import json
 from pathlib import Path
 
-from mscthesis.config.helpers import deep_update
+from mscthesis.config.declaration import BehaviorConfig, ProjectConfig
+from mscthesis.config.helpers import construct_project_config, deep_update
 
 
 def test_deep_update_basic_merge():
@@ -31,3 +33,14 @@ def test_deep_update_preserves_path_instances():
     result = deep_update(a, b)
     assert isinstance(result["path"], Path)
     assert result["path"] == Path("/other")
+
+
+def test_construct_project_config_from_dumped_json():
+    dumped = json.loads(ProjectConfig().dump_json())
+    dumped["behavior"]["sample_id_digits"] = 7
+    config = construct_project_config(dumped)
+    # nested sections are constructed as their models, not left as dicts
+    assert isinstance(config.behavior, BehaviorConfig)
+    assert config.behavior.sample_id_digits == 7
+    # sections absent from the file fall back to coded defaults
+    assert config.meta == ProjectConfig().meta
@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from mscthesis.core import io
+
+
+def _tetrahedron() -> SimpleNamespace:
+    # closed mesh with outward facing (counter-clockwise) triangles
+    vertices = np.array(
+        [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    )
+    triangles = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]])
+    # no precomputed normals, so the encoder derives them from the vertex order
+    return SimpleNamespace(
+        vertices=vertices, triangles=triangles, triangle_normals=np.empty((0, 3))
+    )
+
+
+def test_save_surface_mesh_binary_stl_round_trip(tmp_path):
+    mesh = _tetrahedron()
+    target = tmp_path / "surface_mesh.stl"
+
+    io.save_surface_mesh(mesh, target)
+
+    data = target.read_bytes()
+    num_triangles = int(np.frombuffer(data, dtype="<u4", count=1, offset=80)[0])
+    records = np.frombuffer(data, dtype=io._STL_RECORD, offset=84)
+
+    # header, count and one 50 byte record per triangle
+    assert num_triangles == len(mesh.triangles) == len(records)
+    assert len(data) == 84 + 50 * num_triangles
+    np.testing.assert_allclose(records["vertices"], mesh.vertices[mesh.triangles])
+
+    # unit normals pointing away from the enclosed volume
+    normals = records["normal"]
+    np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1.0, rtol=1e-6)
+    centroids = records["vertices"].mean(axis=1)
+    outward = centroids - mesh.vertices.mean(axis=0)
+    assert np.all(np.einsum("ij,ij->i", normals, outward) > 0)
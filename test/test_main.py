@@ -0,0 +1,13 @@
+from mscthesis.cli import main
+
+
+def test_sniff_subcommand_skips_global_option_values():
+    # an option value equal to a command name is not the command
+    argv = ["--log-filename", "mesh", "triangulate", "00001"]
+    assert main._sniff_subcommand(argv) == "triangulate"
+    assert main._sniff_subcommand(["--log-filename=mesh", "mesh", "00001"]) == "mesh"
+    # flags without values do not consume the command
+    assert main._sniff_subcommand(["--quiet", "config", "show"]) == "config"
+    # unknown or missing commands fall back to the full parser
+    assert main._sniff_subcommand(["unknown", "mesh"]) is None
+    assert main._sniff_subcommand(["--help"]) is None
@@ -1,9 +1,12 @@
 import argparse
+import ast
+import json
 from pathlib import Path
 
 import pytest
 
 from mscthesis.cli import shared
+from mscthesis.config.declaration import BehaviorConfig, ProjectConfig
 
 
 class FakeCmdConfig:
@@ -42,6 +45,18 @@ def test_parse_string_value_literals_and_fallback():
     assert shared.parse_string_value("not_a_literal") == "not_a_literal"
 
 
+@pytest.mark.parametrize(
+    "raw", ["[true]", '{"a": null}', "NaN", "-Infinity", "[1.5, NaN]"]
+)
+def test_parse_string_value_matches_literal_eval(raw):
+    # the json fast path must not change results for JSON-only spellings
+    try:
+        expected = ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        expected = raw
+    assert shared.parse_string_value(raw) == expected
+
+
 def test_derive_flags_and_assemble_overrides(monkeypatch):
     # replace ProjectConfig used inside the module with our fake
     monkeypatch.setattr(shared, "ProjectConfig", FakeProjectConfig)
@@ -106,3 +121,90 @@ def test_initialize_parsers_adds_config_flag_and_requires_subcommand(monkeypatch
     # trying to parse with no subcommand should fail (required subparsers)
     with pytest.raises(SystemExit):
         parser.parse_args([])  # no command supplied
+
+
+@pytest.mark.parametrize("num_samples,size", [(4, 4), (5, 4), (3, 4), (0, 2), (7, 1)])
+def test_partition_sample_ids_covers_all_samples(num_samples, size):
+    sample_ids = [f"{i:05d}" for i in range(num_samples)]
+    shares = shared._partition_sample_ids(sample_ids, size)
+
+    # one share per rank, including the last one when size == number of samples
+    assert len(shares) == size
+    # every sample assigned exactly once
+    assert sorted(sid for share in shares for sid in share) == sample_ids
+
+
+def test_interpret_sample_input_drops_repeated_ids(tmp_path):
+    inventory = tmp_path / "ids.txt"
+    inventory.write_text("00002\n00001\n\n00002\n00003\n")
+    paths = shared.ProjectPaths(tmp_path)
+
+    sample_ids = shared.interpret_sample_input(paths, str(inventory), 5)
+
+    # first occurrence order kept, blank lines ignored
+    assert sample_ids == ["00002", "00001", "00003"]
+
+
+def test_interpret_sample_input_rejects_several_ids_per_line(tmp_path):
+    inventory = tmp_path / "ids.txt"
+    inventory.write_text("00001 00002\n00003\n")
+    paths = shared.ProjectPaths(tmp_path)
+
+    with pytest.raises(ValueError):
+        shared.interpret_sample_input(paths, str(inventory), 5)
+
+
+def test_drop_completed_keeps_failed_and_missing_samples(tmp_path):
+    paths = shared.ProjectPaths(tmp_path)
+    manifests = {
+        "00001": {"meta": {"success": True, "brep_exported": True}},
+        "00002": {"meta": {"success": False, "brep_exported": False}},
+        "00003": {"meta": {"success": True, "brep_exported": False}},
+    }
+    for sample_id, manifest in manifests.items():
+        process = paths.sample(sample_id).triangulation()
+        process.ensure_dir()
+        process.manifest.write_text(json.dumps(manifest))
+
+    sample_ids = ["00001", "00002", "00003", "00004"]
+    manifests = shared._load_previous_manifests(
+        paths, sample_ids, shared.SamplePaths.triangulation
+    )
+    remaining = shared._drop_completed(sample_ids, manifests)
+
+    # only the successful sample is skipped; failed and unprocessed ones are rerun
+    assert remaining == ["00002", "00003", "00004"]
+
+
+def test_skip_completed_rejected_without_manifests(tmp_path):
+    behavior = BehaviorConfig(
+        storage_root=tmp_path, skip_completed=True, no_manifest=True
+    )
+    args = argparse.Namespace(
+        config=ProjectConfig(behavior=behavior), sample_input="00001"
+    )
+
+    def _never_called(*_):
+        raise AssertionError("no sample should be executed")
+
+    with pytest.raises(ValueError, match="no_manifest"):
+        shared.distribute_command_execution(
+            args, None, _never_called, shared.SamplePaths.triangulation
+        )
+
+
+def test_order_by_previous_runtime_longest_first(tmp_path):
+    paths = shared.ProjectPaths(tmp_path)
+    for sample_id, elapsed in [("00001", 1.0), ("00002", 5.0), ("00003", 3.0)]:
+        process = paths.sample(sample_id).meshing()
+        process.ensure_dir()
+        process.manifest.write_text(json.dumps({"elapsed_seconds": elapsed}))
+
+    sample_ids = ["00001", "00002", "00003", "00004"]
+    manifests = shared._load_previous_manifests(
+        paths, sample_ids, shared.SamplePaths.meshing
+    )
+    ordered = shared._order_by_previous_runtime(sample_ids, manifests)
+
+    # unknown runtimes first, then longest-first
+    assert ordered == ["00004", "00002", "00003", "00001"]
@@ -0,0 +1,78 @@
+import argparse
+import sys
+import threading
+import time
+import types
+
+import numpy as np
+import pytest
+
+from mscthesis.cli.commands import triangulate
+from mscthesis.config.declaration import (
+    BehaviorConfig,
+    ProjectConfig,
+    TriangulationConfig,
+)
+from mscthesis.core import io
+from mscthesis.utilities.paths import ProjectPaths
+
+SAMPLE_IDS = ["00001", "00002", "00003"]
+
+
+@pytest.fixture
+def batch(tmp_path, monkeypatch):
+    # voxel models to triangulate, and an inventory listing them
+    paths = ProjectPaths(tmp_path)
+    for sample_id in SAMPLE_IDS:
+        synthesis = paths.sample(sample_id).synthesis()
+        synthesis.ensure_dir()
+        io.save_voxels(np.zeros((4, 4, 4), dtype=np.uint8), synthesis.voxels)
+    inventory = tmp_path / "ids.txt"
+    inventory.write_text("\n".join(SAMPLE_IDS))
+
+    # stand-in for the open3d/skimage pipeline; unsuccessful meshes skip BREP export
+    fake = types.ModuleType("mscthesis.core.meshing.triangulation")
+    fake.triangulate_voxels = lambda voxels, *_: (object(), {"success": False})
+    monkeypatch.setitem(sys.modules, fake.__name__, fake)
+
+    config = ProjectConfig(
+        behavior=BehaviorConfig(storage_root=tmp_path),
+        triangulate=TriangulationConfig(no_freecad_daemon=True),
+    )
+    args = argparse.Namespace(config=config, sample_input=str(inventory))
+    return paths, args
+
+
+def test_background_save_failure_is_raised(batch, monkeypatch):
+    _, args = batch
+    saving = threading.get_ident()
+
+    def _failing_save(mesh, file_path):
+        nonlocal saving
+        saving = threading.get_ident()
+        raise OSError("disk full")
+
+    monkeypatch.setattr(io, "save_surface_mesh", _failing_save)
+
+    with pytest.raises(OSError, match="disk full"):
+        triangulate._cmd(args, None)
+    # the save ran in the background, not on the calling thread
+    assert saving != threading.get_ident()
+
+
+def test_pending_saves_are_drained_before_returning(batch, monkeypatch):
+    paths, args = batch
+
+    def _slow_save(mesh, file_path):
+        time.sleep(0.05)
+        file_path.write_bytes(b"stl")
+
+    monkeypatch.setattr(io, "save_surface_mesh", _slow_save)
+
+    triangulate._cmd(args, None)
+
+    # every sample was saved and documented by the time the command returns
+    for sample_id in SAMPLE_IDS:
+        process = paths.sample(sample_id).triangulation()
+        assert process.mesh.read_bytes() == b"stl"
+        assert process.manifest.is_file()
@@ -0,0 +1,67 @@
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("open3d")
+pytest.importorskip("skimage")
+
+from mscthesis.core.meshing import triangulation  # noqa: E402
+
+
+def _voxel_sphere(size: int = 32, radius: float = 10.0) -> np.ndarray:
+    # solid sphere away from the grid boundary, so its surface is closed
+    x, y, z = np.ogrid[:size, :size, :size]
+    center = (size - 1) / 2
+    distance = (x - center) ** 2 + (y - center) ** 2 + (z - center) ** 2
+    return (distance <= radius**2).astype(np.uint8)
+
+
+def test_triangulate_voxel_sphere_is_closed_manifold():
+    mesh, metadata = triangulation.triangulate_voxels(
+        _voxel_sphere(), smoothing_iterations=5, decimation_target=1_000
+    )
+
+    assert metadata["success"]
+    assert mesh.is_edge_manifold() and mesh.is_vertex_manifold()
+    assert mesh.is_watertight()
+    assert metadata["num_faces"] <= 1_000
+    for key in ("pre_area", "post_area", "pre_volume", "post_volume"):
+        assert math.isfinite(metadata[key]) and metadata[key] > 0
+
+
+def _unit_cube() -> tuple[np.ndarray, np.ndarray]:
+    vertices = np.array(
+        [[x, y, z] for x in (0.0, 1.0) for y in (0.0, 1.0) for z in (0.0, 1.0)]
+    )
+    # two outward facing triangles per face
+    triangles = np.array(
+        [
+            [0, 1, 3], [0, 3, 2],  # x = 0
+            [4, 6, 7], [4, 7, 5],  # x = 1
+            [0, 4, 5], [0, 5, 1],  # y = 0
+            [2, 3, 7], [2, 7, 6],  # y = 1
+            [0, 2, 6], [0, 6, 4],  # z = 0
+            [1, 5, 7], [1, 7, 3],  # z = 1
+        ]
+    )  # fmt: skip
+    return vertices, triangles
+
+
+def test_area_volume_of_closed_unit_cube():
+    vertices, triangles = _unit_cube()
+
+    area, volume = triangulation._area_volume(vertices, triangles, closed=True)
+
+    assert area == pytest.approx(6.0)
+    assert volume == pytest.approx(1.0)
+
+
+def test_area_volume_of_open_unit_cube_has_no_volume():
+    vertices, triangles = _unit_cube()
+
+    # drop the top face: the area shrinks and the volume is undefined
+    area, volume = triangulation._area_volume(vertices, triangles[:-2], closed=False)
+
+    assert area == pytest.approx(5.0)
+    assert volume is None